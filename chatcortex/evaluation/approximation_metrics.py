@@ -1,8 +1,18 @@
 import random
 from typing import Iterable, List, Tuple
 
+import numpy as np
+
 from chatcortex.optimization.architecture_candidate import ArchitectureCandidate
 from chatcortex.optimization.pareto import dominates, frontier_coverage, hypervolume_monte_carlo
+from chatcortex.optimization.vectorized import (
+    DEFAULT_CHUNK_ELEMENTS,
+    chunk_rows,
+    dominance_matrix,
+    iter_chunks,
+    objective_matrix,
+    weakly_dominated_mask,
+)
 
 
 def compute_coverage(
@@ -121,6 +131,120 @@ def average_regret(
         total_reliability_regret / n,
     )
 
+# Vectorized metrics
+#
+# NumPy equivalents of the loops above. Regret values are identical,
+# hypervolume estimates use a NumPy Generator and therefore differ from
+# the pure-Python versions by Monte Carlo noise only.
+
+def hypervolume_loss_vectorized(
+    approx_frontier: Iterable[ArchitectureCandidate],
+    true_frontier: Iterable[ArchitectureCandidate],
+    reference_point: Tuple[float, float, float],
+    num_samples: int = 200000,
+    seed: int = 42,
+    sample_chunk_size: int = 50000,
+) -> float:
+    """
+    Hypervolume loss with one shared sample matrix for both fronts
+
+    Samples are generated and tested in chunks of sample_chunk_size rows,
+    so memory stays bounded regardless of num_samples. The sample stream
+    does not depend on the chunk size.
+    """
+
+    ref_cost, ref_latency, ref_reliability = reference_point
+
+    true_matrix = objective_matrix(true_frontier)
+    approx_matrix = objective_matrix(approx_frontier)
+
+    low = np.array([0.0, 0.0, ref_reliability])
+    high = np.array([ref_cost, ref_latency, 1.0])
+
+    random_number_generator = np.random.default_rng(seed)
+
+    dominated_true = 0
+    dominated_approx = 0
+
+    for start, end in iter_chunks(num_samples, sample_chunk_size):
+        samples = low + (high - low) * random_number_generator.random((end - start, 3))
+
+        dominated_true += int(weakly_dominated_mask(true_matrix, samples).sum())
+        dominated_approx += int(weakly_dominated_mask(approx_matrix, samples).sum())
+
+    box_volume = ref_cost * ref_latency * (1.0 - ref_reliability)
+
+    hv_true = (dominated_true / num_samples) * box_volume
+    hv_approx = (dominated_approx / num_samples) * box_volume
+
+    return max(0.0, hv_true - hv_approx)
+
+
+def additive_regret_vectorized(
+    approx_frontier: Iterable[ArchitectureCandidate],
+    true_frontier: Iterable[ArchitectureCandidate],
+    max_elements: int = DEFAULT_CHUNK_ELEMENTS,
+) -> np.ndarray:
+    """
+    Per-candidate additive regret for a whole approx frontier
+
+    returns
+        - (n_approx, 3) array of (cost_regret, latency_regret, reliability_regret)
+
+    Dominance between the fronts is computed as one broadcast per chunk
+    of approx candidates.
+    """
+
+    approx_matrix = objective_matrix(approx_frontier)
+    true_matrix = objective_matrix(true_frontier)
+
+    regret = np.zeros((len(approx_matrix), 3), dtype=float)
+
+    if len(approx_matrix) == 0 or len(true_matrix) == 0:
+        return regret
+
+    chunk = chunk_rows(len(true_matrix), max_elements)
+
+    for start, end in iter_chunks(len(approx_matrix), chunk):
+        block = approx_matrix[start:end]
+
+        # [i, j]: true point i dominates approx candidate j
+        dominating = dominance_matrix(true_matrix, block)
+        has_dominator = dominating.any(axis=0)
+
+        differences = (
+            block[None, :, 0] - true_matrix[:, None, 0],
+            block[None, :, 1] - true_matrix[:, None, 1],
+            true_matrix[:, None, 2] - block[None, :, 2],
+        )
+
+        for objective, difference in enumerate(differences):
+            smallest = np.where(dominating, difference, np.inf).min(axis=0)
+            regret[start:end, objective] = np.where(
+                has_dominator, np.maximum(0.0, smallest), 0.0
+            )
+
+    return regret
+
+
+def average_regret_vectorized(
+    approx_frontier: Iterable[ArchitectureCandidate],
+    true_frontier: Iterable[ArchitectureCandidate],
+) -> Tuple[float, float, float]:
+    """
+    Average additive regret across approx frontier
+    """
+
+    regret = additive_regret_vectorized(approx_frontier, true_frontier)
+
+    if len(regret) == 0:
+        return (0.0, 0.0, 0.0)
+
+    mean = regret.mean(axis=0)
+
+    return (float(mean[0]), float(mean[1]), float(mean[2]))
+
+
 def evaluate_approximation(
     approx_frontier: List[ArchitectureCandidate],
     true_frontier: List[ArchitectureCandidate],
@@ -128,12 +252,14 @@ def evaluate_approximation(
 ) -> dict:
     """
     Returns a full approximate report
+
+    Uses the vectorized hypervolume and regret kernels
     """
 
     coverage = compute_coverage(approx_frontier, true_frontier)
     
-    hv_loss = hypervolume_loss(approx_frontier, true_frontier, reference_point)
-    avg_regret = average_regret(approx_frontier, true_frontier)
+    hv_loss = hypervolume_loss_vectorized(approx_frontier, true_frontier, reference_point)
+    avg_regret = average_regret_vectorized(approx_frontier, true_frontier)
 
     return {
         "coverage": coverage,
@@ -0,0 +1,503 @@
+import asyncio
+import zlib
+from abc import ABC, abstractmethod
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Dict, List, Literal, Optional, Sequence, Tuple
+
+import numpy as np
+
+from chatcortex.execution.executor import AgentExecutor, ExecutionMode
+from chatcortex.graph.agent_graph import AgentGraph
+from chatcortex.optimization.vectorized import dominance_matrix, non_dominated_mask
+from chatcortex.registry.metadata import ComponentMetadata
+from chatcortex.synthesis.budget import BudgetExceeded, SynthesisContext
+
+
+EvaluatorConcurrency = Literal["serial", "thread", "process", "asyncio"]
+
+# (total_cost, total_latency, total_reliability)
+Objectives = Tuple[float, float, float]
+
+Architecture = Sequence[ComponentMetadata]
+
+
+def _evaluate_one(evaluator: "Evaluator", components: Architecture) -> Objectives:
+    """
+    Worker: evaluate one architecture in a process pool
+    """
+    return evaluator.evaluate_one(components)
+
+
+class Evaluator(ABC):
+    """
+    Batched, pluggable architecture evaluator
+
+    Scores chain architectures (component lists in stage order) with
+    (total_cost, total_latency, total_reliability).
+
+    evaluate_batch():
+        - registers one evaluation per submitted architecture against the
+          optional SynthesisContext and drops the rest of the batch once
+          the budget is exhausted
+        - deduplicates the batch and, with cache=True, reuses results by
+          architecture key (component names) across batches
+        - evaluates the remaining architectures serially, on a thread or
+          process pool, or concurrently on asyncio (evaluate_one_async)
+        - may return None for an architecture the evaluator discarded as
+          not competitive (never cached); callers skip it like an
+          infeasible one
+
+    batch_size:
+        Preferred batch size for synthesizers that stream candidates
+
+    Pools are created lazily and kept until close(). Process mode pickles
+    the evaluator (without pool and cache) to the workers, so subclasses
+    must be picklable.
+    """
+
+    def __init__(
+        self,
+        concurrency: EvaluatorConcurrency = "serial",
+        max_workers: Optional[int] = None,
+        cache: bool = True,
+        batch_size: int = 64,
+    ):
+        if concurrency not in ("serial", "thread", "process", "asyncio"):
+            raise ValueError(f"Invalid evaluator concurrency: {concurrency}")
+
+        if batch_size < 1:
+            raise ValueError("batch_size must be positive")
+
+        self.concurrency = concurrency
+        self.max_workers = max_workers
+        self.batch_size = batch_size
+        self.cache: Optional[Dict[Tuple[str, ...], Objectives]] = {} if cache else None
+        self._pool: Optional[Executor] = None
+
+    @abstractmethod
+    def evaluate_one(self, components: Architecture) -> Objectives:
+        pass
+
+    async def evaluate_one_async(self, components: Architecture) -> Objectives:
+        """
+        Used in asyncio mode. Defaults to evaluate_one in a thread,
+        override for natively asynchronous evaluation.
+        """
+        return await asyncio.to_thread(self.evaluate_one, components)
+
+    @staticmethod
+    def architecture_key(components: Architecture) -> Tuple[str, ...]:
+        return tuple(component.name for component in components)
+
+    def evaluate_batch(
+        self,
+        architectures: Sequence[Architecture],
+        context: Optional[SynthesisContext] = None,
+    ) -> List[Optional[Objectives]]:
+        """
+        Objectives for the leading architectures admitted by the budget
+
+        The result is shorter than the input iff the budget ran out.
+        """
+
+        architectures = list(architectures)
+
+        if context is not None:
+            admitted = 0
+            for _ in architectures:
+                try:
+                    context.register_evaluation()
+                except BudgetExceeded:
+                    break
+                admitted += 1
+            architectures = architectures[:admitted]
+
+        keys = [self.architecture_key(components) for components in architectures]
+        results: Dict[Tuple[str, ...], Optional[Objectives]] = {}
+        pending: Dict[Tuple[str, ...], Architecture] = {}
+
+        for key, components in zip(keys, architectures):
+            if key in results or key in pending:
+                continue
+            if self.cache is not None and key in self.cache:
+                results[key] = self.cache[key]
+            else:
+                pending[key] = components
+
+        if pending:
+            for key, objectives in zip(pending, self._run(list(pending.values()), context)):
+                if objectives is not None:
+                    objectives = tuple(objectives)
+                    if self.cache is not None:
+                        self.cache[key] = objectives
+                results[key] = objectives
+
+        return [results[key] for key in keys]
+
+    async def evaluate_batch_async(
+        self,
+        architectures: Sequence[Architecture],
+    ) -> List[Objectives]:
+        """
+        Evaluate a batch with evaluate_one_async, at most max_workers at a
+        time (no caching or budget, for use inside a running event loop)
+        """
+
+        semaphore = asyncio.Semaphore(self.max_workers or len(architectures) or 1)
+
+        async def run(components: Architecture) -> Objectives:
+            async with semaphore:
+                return await self.evaluate_one_async(components)
+
+        return list(await asyncio.gather(*(run(c) for c in architectures)))
+
+    def _run(
+        self,
+        architectures: List[Architecture],
+        context: Optional[SynthesisContext] = None,
+    ) -> List[Objectives]:
+
+        if self.concurrency == "asyncio" and len(architectures) > 1:
+            return asyncio.run(self.evaluate_batch_async(architectures))
+
+        if self.concurrency == "process":
+            return self._map(_evaluate_one, [self] * len(architectures), architectures)
+
+        return self._map(self.evaluate_one, architectures)
+
+    def _map(self, fn: Callable, *iterables) -> List:
+        """
+        map() in the configured concurrency mode (asyncio maps on threads)
+
+        In process mode fn and its arguments must be picklable.
+        """
+
+        args = list(zip(*iterables))
+
+        if self.concurrency == "serial" or len(args) <= 1:
+            return [fn(*arg) for arg in args]
+
+        if self.concurrency == "asyncio":
+            async def gather():
+                return await asyncio.gather(*(asyncio.to_thread(fn, *arg) for arg in args))
+
+            return list(asyncio.run(gather()))
+
+        if self._pool is None:
+            pool_type = ThreadPoolExecutor if self.concurrency == "thread" else ProcessPoolExecutor
+            self._pool = pool_type(max_workers=self.max_workers)
+
+        return list(self._pool.map(fn, *zip(*args)))
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __enter__(self) -> "Evaluator":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_pool"] = None
+        state["cache"] = None
+        return state
+
+
+def analytic_objectives(components: Architecture) -> Objectives:
+    """
+    Static metric sums, accumulated in AgentGraph order
+    """
+
+    total_cost = 0.0
+    total_latency = 0.0
+    total_reliability = 1.0
+
+    for component in components:
+        total_cost += component.cost_per_call
+        total_latency += component.avg_latency_ms
+        total_reliability *= component.reliability_score
+
+    return total_cost, total_latency, total_reliability
+
+
+class AnalyticEvaluator(Evaluator):
+    """
+    Static metric sums, accumulated in AgentGraph order (bit-identical
+    to graph.total_cost() etc.)
+    """
+
+    def __init__(
+        self,
+        concurrency: EvaluatorConcurrency = "serial",
+        max_workers: Optional[int] = None,
+        cache: bool = False,
+        batch_size: int = 64,
+    ):
+        super().__init__(concurrency, max_workers, cache, batch_size)
+
+    def evaluate_one(self, components: Architecture) -> Objectives:
+        return analytic_objectives(components)
+
+
+class SimulationEvaluator(Evaluator):
+    """
+    Monte Carlo evaluation through AgentExecutor
+
+    Runs every architecture num_runs times and reports mean realized cost
+    and latency (a failing component stops the pipeline, so failed runs
+    are cheaper) and the empirical success rate as reliability.
+
+    The executor seed of an architecture is derived from seed and its
+    component names, so results do not depend on batch order or
+    concurrency mode.
+    """
+
+    def __init__(
+        self,
+        num_runs: int = 100,
+        mode: ExecutionMode = "probabilistic",
+        seed: Optional[int] = 42,
+        concurrency: EvaluatorConcurrency = "serial",
+        max_workers: Optional[int] = None,
+        cache: bool = True,
+        batch_size: int = 64,
+    ):
+        super().__init__(concurrency, max_workers, cache, batch_size)
+
+        if num_runs < 1:
+            raise ValueError("num_runs must be positive")
+
+        self.num_runs = num_runs
+        self.mode = mode
+        self.seed = seed
+
+    def _executor_seed(self, components: Architecture, block: int = 0) -> Optional[int]:
+        if self.seed is None:
+            return None
+        names = "\0".join(self.architecture_key(components))
+        if block:
+            names += f"\0#{block}"
+        return self.seed ^ zlib.crc32(names.encode())
+
+    def _simulate(
+        self,
+        components: Architecture,
+        num_runs: int,
+        block: int = 0,
+    ) -> Tuple[float, float, int, float, float]:
+        """
+        (cost sum, latency sum, successes, cost sum of squares, latency
+        sum of squares) over num_runs executions
+
+        Blocks are independently seeded batches of runs of the same
+        architecture.
+        """
+
+        graph = AgentGraph.from_chain(components)
+        executor = AgentExecutor(mode=self.mode, seed=self._executor_seed(components, block))
+
+        total_cost = 0.0
+        total_latency = 0.0
+        successes = 0
+        cost_squares = 0.0
+        latency_squares = 0.0
+
+        for _ in range(num_runs):
+            summary = executor.execute(graph).summary()
+            total_cost += summary["total_cost"]
+            total_latency += summary["total_latency"]
+            successes += summary["success"]
+            cost_squares += summary["total_cost"] ** 2
+            latency_squares += summary["total_latency"] ** 2
+
+        return total_cost, total_latency, successes, cost_squares, latency_squares
+
+    def evaluate_one(self, components: Architecture) -> Objectives:
+        total_cost, total_latency, successes, _, _ = self._simulate(components, self.num_runs)
+
+        return (
+            total_cost / self.num_runs,
+            total_latency / self.num_runs,
+            successes / self.num_runs,
+        )
+
+
+class MultiFidelityEvaluator(SimulationEvaluator):
+    """
+    Successive-halving simulation over a batch
+
+    1. Screen every architecture with the analytic metrics
+    2. Simulate those that are non-dominated or close to the front of the
+       batch with min_trials runs
+    3. Repeatedly multiply the trial count by eta (up to max_trials),
+       giving the extra runs only to architectures still non-dominated
+       or close to the front of the current estimates
+
+    "Close" means that the architecture's optimistic estimate (mean
+    improved by confidence standard errors) is not dominated by the
+    pessimistic estimate (mean worsened by confidence standard errors,
+    then by the relative tolerance) of any front point. Low trial counts
+    have wide margins, so noisy early estimates rarely discard a true
+    front member.
+
+    Architectures screened out on the way are returned as None
+    (discarded), so low-fidelity estimates never compete with
+    full-fidelity ones. Screening is relative to the batch: larger
+    batches screen more effectively.
+
+    Budget:
+        One evaluation per submitted architecture, as for every
+        evaluator. Promotion stops early when the time budget runs out;
+        architectures that did not reach max_trials are then returned as
+        None and not cached, so a later call evaluates them again.
+        simulated_trials counts executions run in this process.
+    """
+
+    def __init__(
+        self,
+        min_trials: int = 8,
+        max_trials: int = 128,
+        eta: int = 2,
+        tolerance: float = 0.05,
+        confidence: float = 2.0,
+        mode: ExecutionMode = "probabilistic",
+        seed: Optional[int] = 42,
+        concurrency: EvaluatorConcurrency = "serial",
+        max_workers: Optional[int] = None,
+        cache: bool = True,
+        batch_size: int = 256,
+    ):
+        super().__init__(
+            num_runs=max_trials,
+            mode=mode,
+            seed=seed,
+            concurrency=concurrency,
+            max_workers=max_workers,
+            cache=cache,
+            batch_size=batch_size,
+        )
+
+        if not 1 <= min_trials <= max_trials:
+            raise ValueError("Require 1 <= min_trials <= max_trials")
+
+        if eta < 2:
+            raise ValueError("eta must be at least 2")
+
+        if tolerance < 0 or confidence < 0:
+            raise ValueError("tolerance and confidence must be non-negative")
+
+        self.min_trials = min_trials
+        self.max_trials = max_trials
+        self.eta = eta
+        self.tolerance = tolerance
+        self.confidence = confidence
+        self.simulated_trials = 0
+
+        # Cumulative trial count per rung
+        self.schedule = [min_trials]
+        while self.schedule[-1] < max_trials:
+            self.schedule.append(min(max_trials, self.schedule[-1] * eta))
+
+    def _near_front(self, points: np.ndarray, errors: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Mask of points whose optimistic estimate is not dominated by the
+        pessimistic, tolerance-worsened front
+
+        errors: standard errors per point and objective (None: exact)
+        """
+
+        # Worse direction per objective
+        worse = np.array([1.0, 1.0, -1.0])
+        margins = np.zeros_like(points) if errors is None else self.confidence * errors
+
+        front = non_dominated_mask(points)
+        pessimistic = (points[front] + margins[front] * worse) * (1.0 + self.tolerance * worse)
+        optimistic = points - margins * worse
+
+        return ~dominance_matrix(pessimistic, optimistic).any(axis=0)
+
+    @staticmethod
+    def _statistics(sums: np.ndarray, trials: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Means and standard errors from per-architecture simulation sums
+
+        Reliability uses the add-one smoothed success rate, so all-success
+        or all-failure blocks still get a margin.
+        """
+
+        means = sums[:, :3] / trials
+        variances = np.maximum(sums[:, 3:] / trials - means[:, :2] ** 2, 0.0)
+
+        smoothed = (sums[:, 2] + 1.0) / (trials + 2.0)
+        errors = np.column_stack((variances, smoothed * (1.0 - smoothed)))
+
+        return means, np.sqrt(errors / trials)
+
+    def evaluate_one(self, components: Architecture) -> Objectives:
+        """
+        Full-fidelity estimate (same runs as the top rung)
+        """
+
+        sums = np.zeros(5)
+        previous = 0
+
+        for rung, total in enumerate(self.schedule):
+            sums += self._simulate(components, total - previous, rung)
+            previous = total
+
+        return tuple((sums[:3] / previous).tolist())
+
+    def _run(
+        self,
+        architectures: List[Architecture],
+        context: Optional[SynthesisContext] = None,
+    ) -> List[Optional[Objectives]]:
+
+        estimates = np.array(
+            [analytic_objectives(components) for components in architectures],
+            dtype=float,
+        ).reshape(-1, 3)
+        sums = np.zeros((len(architectures), 5))
+
+        active = np.flatnonzero(self._near_front(estimates))
+        previous = 0
+
+        for rung, total in enumerate(self.schedule):
+
+            if rung > 0 and context is not None and not context.within_time_limit():
+                break
+
+            count = total - previous
+
+            blocks = self._map(
+                self._simulate,
+                [architectures[i] for i in active],
+                [count] * len(active),
+                [rung] * len(active),
+            )
+            self.simulated_trials += count * len(active)
+
+            sums[active] += np.array(blocks, dtype=float).reshape(-1, 5)
+            estimates[active], errors = self._statistics(sums[active], total)
+
+            previous = total
+
+            if total == self.max_trials:
+                break
+
+            active = active[self._near_front(estimates[active], errors)]
+
+        # Architectures promoted through the whole schedule (none if time
+        # ran out first: partial estimates must not reach the cache)
+        kept = np.zeros(len(architectures), dtype=bool)
+        if previous == self.max_trials:
+            kept[active] = True
+
+        return [
+            tuple(estimate) if keep else None
+            for estimate, keep in zip(estimates.tolist(), kept.tolist())
+        ]
@@ -1,5 +1,5 @@
 import networkx as nx
-from typing import List
+from typing import Iterable, List, Tuple
 from chatcortex.registry.metadata import ComponentMetadata
 
 
@@ -17,6 +17,28 @@ class AgentGraph:
         self._graph = nx.DiGraph()
     
 
+    @classmethod
+    def from_chain(cls, components: Iterable[ComponentMetadata]) -> "AgentGraph":
+        """
+        Build a linear pipeline: one node per component, in order
+
+        Node ids follow the synthesizer convention f"{name}_{stage_idx}"
+        """
+
+        graph = cls()
+        previous_node = None
+
+        for idx, component in enumerate(components):
+            node_id = f"{component.name}_{idx}"
+            graph.add_component(node_id, component)
+
+            if previous_node:
+                graph.add_edge(previous_node, node_id)
+
+            previous_node = node_id
+
+        return graph
+
     # Node management
     def add_component(self, node_id: str, metadata: ComponentMetadata) -> None:
         if node_id in self._graph:
@@ -71,6 +93,15 @@ class AgentGraph:
     
     def list_nodes(self) -> List[str]:
         return list(self._graph.nodes)
+
+    def architecture_key(self) -> Tuple[str, ...]:
+        """
+        Lightweight value identity: component names in execution order
+        """
+
+        return tuple(
+            self.get_metadata(n).name for n in self.get_execution_order()
+        )
     
     # Aggregate Metrics
 
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Tuple
 
 from chatcortex.graph.agent_graph import AgentGraph
 
@@ -20,4 +21,105 @@ class ArchitectureCandidate:
             "cost": self.total_cost,
             "latency": self.total_latency,
             "reliability": self.total_reliability,
-        }
\ No newline at end of file
+        }
+
+    def architecture_key(self) -> Tuple[str, ...]:
+        return self.graph.architecture_key()
+
+    def to_compact(self) -> "CompactCandidate":
+        return CompactCandidate(
+            self.architecture_key(),
+            (self.total_cost, self.total_latency, self.total_reliability),
+        )
+
+
+class CompactCandidate:
+    """
+    Slotted, graph-free architecture candidate
+
+    Stores only:
+        - architecture_key: component names in execution order
+        - objectives: (total_cost, total_latency, total_reliability)
+
+    Equality and hashing are value-based, so ParetoSet deduplicates
+    identical architectures. Exposes the same total_* attributes as
+    ArchitectureCandidate and can be used wherever only metrics are read
+    (dominance, ParetoSet, merge, evaluation metrics).
+
+    Rebuild the full graph on demand with materialize(registry).
+    """
+
+    __slots__ = ("architecture_key", "objectives")
+
+    def __init__(
+        self,
+        architecture_key: Tuple[str, ...],
+        objectives: Tuple[float, float, float],
+    ):
+        object.__setattr__(self, "architecture_key", tuple(architecture_key))
+        object.__setattr__(self, "objectives", tuple(objectives))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("CompactCandidate is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("CompactCandidate is immutable")
+
+    def __reduce__(self):
+        return (CompactCandidate, (self.architecture_key, self.objectives))
+
+    @property
+    def total_cost(self) -> float:
+        return self.objectives[0]
+
+    @property
+    def total_latency(self) -> float:
+        return self.objectives[1]
+
+    @property
+    def total_reliability(self) -> float:
+        return self.objectives[2]
+
+    def metrics(self):
+        return {
+            "cost": self.total_cost,
+            "latency": self.total_latency,
+            "reliability": self.total_reliability,
+        }
+
+    @classmethod
+    def from_candidate(cls, candidate: ArchitectureCandidate) -> "CompactCandidate":
+        return candidate.to_compact()
+
+    def materialize(self, registry) -> ArchitectureCandidate:
+        """
+        Rebuild the full ArchitectureCandidate from registry metadata
+        """
+
+        graph = AgentGraph.from_chain(
+            registry.get(name) for name in self.architecture_key
+        )
+
+        return ArchitectureCandidate(
+            graph=graph,
+            total_cost=self.total_cost,
+            total_latency=self.total_latency,
+            total_reliability=self.total_reliability,
+        )
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, CompactCandidate):
+            return NotImplemented
+        return (
+            self.architecture_key == other.architecture_key
+            and self.objectives == other.objectives
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.architecture_key, self.objectives))
+
+    def __repr__(self) -> str:
+        return (
+            f"CompactCandidate(architecture_key={self.architecture_key!r}, "
+            f"objectives={self.objectives!r})"
+        )
@@ -0,0 +1,194 @@
+import math
+from typing import Dict, Literal, Optional, Sequence, Tuple, Union
+
+from chatcortex.optimization.architecture_candidate import ArchitectureCandidate
+from chatcortex.optimization.pareto import ParetoSet, dominates
+
+
+EpsilonMode = Literal["additive", "multiplicative"]
+
+Box = Tuple[float, float, float]
+
+
+class EpsilonParetoSet(ParetoSet):
+    """
+    Bounded-memory epsilon-dominance archive (Laumanns et al. box archive)
+
+    Objective space (cost, latency, 1 - reliability) is minimized and
+    partitioned into a grid of boxes:
+
+        additive:        box_i = floor(f_i / eps_i)
+        multiplicative:  box_i = floor(log(f_i) / log(1 + eps_i))
+
+    At most one representative is kept per box and no kept box is
+    dominated by another kept box.
+
+    Guarantees:
+        - Approximation: every candidate ever offered to the archive is
+          epsilon-dominated by a member, i.e. for every objective
+          member_i <= f_i + eps_i (additive) or
+          member_i <= (1 + eps_i) * f_i (multiplicative)
+        - Size: with K_i boxes along objective i, the archive never holds
+          more than prod(K) / max(K) members (see size_bound)
+
+    Drop-in replacement for ParetoSet, e.g.:
+        ExhaustiveSynthesizer(
+            registry,
+            archive_factory=lambda: EpsilonParetoSet(epsilon=(1e-4, 5.0, 1e-3)),
+        )
+    """
+
+    def __init__(
+        self,
+        epsilon: Union[float, Sequence[float]] = 0.01,
+        mode: EpsilonMode = "additive",
+    ):
+        super().__init__()
+
+        if isinstance(epsilon, (int, float)):
+            epsilon = (float(epsilon),) * 3
+
+        epsilon = tuple(float(e) for e in epsilon)
+
+        if len(epsilon) != 3:
+            raise ValueError("epsilon must be a scalar or a (cost, latency, error) triple")
+
+        if any(e <= 0.0 for e in epsilon):
+            raise ValueError("epsilon values must be strictly positive")
+
+        if mode not in ("additive", "multiplicative"):
+            raise ValueError(f"Invalid epsilon mode: {mode}")
+
+        self.epsilon: Tuple[float, float, float] = epsilon
+        self.mode = mode
+        self._boxes: Dict[Box, ArchitectureCandidate] = {}
+
+    # Grid geometry
+
+    @staticmethod
+    def _objectives(candidate: ArchitectureCandidate) -> Tuple[float, float, float]:
+        return (
+            candidate.total_cost,
+            candidate.total_latency,
+            1.0 - candidate.total_reliability,
+        )
+
+    def _box_coordinate(self, value: float, eps: float) -> float:
+        if self.mode == "additive":
+            return float(math.floor(value / eps))
+
+        # Multiplicative grid is undefined at zero - collapse onto lowest box
+        if value <= 0.0:
+            return float("-inf")
+
+        return float(math.floor(math.log(value) / math.log1p(eps)))
+
+    def box(self, candidate: ArchitectureCandidate) -> Box:
+        return tuple(
+            self._box_coordinate(value, eps)
+            for value, eps in zip(self._objectives(candidate), self.epsilon)
+        )
+
+    def _distance_to_corner(self, candidate: ArchitectureCandidate, box: Box) -> float:
+        """
+        Squared distance (in epsilon units) to the lower corner of its box
+        """
+
+        distance = 0.0
+
+        for value, eps, coordinate in zip(self._objectives(candidate), self.epsilon, box):
+            if self.mode == "additive":
+                offset = value / eps - coordinate
+            elif value <= 0.0:
+                offset = 0.0
+            else:
+                offset = math.log(value) / math.log1p(eps) - coordinate
+            distance += offset * offset
+
+        return distance
+
+    @staticmethod
+    def _box_dominates(a: Box, b: Box) -> bool:
+        return a != b and all(x <= y for x, y in zip(a, b))
+
+    def size_bound(
+        self,
+        upper_bounds: Tuple[float, float, float],
+        lower_bounds: Optional[Tuple[float, float, float]] = None,
+    ) -> int:
+        """
+        Upper bound on archive size for objectives within the given bounds
+
+        upper_bounds / lower_bounds:
+            (cost, latency, 1 - reliability) extremes of the search space.
+            lower_bounds are required in multiplicative mode and must be
+            strictly positive there (a zero objective adds one extra box)
+        """
+
+        counts = []
+
+        for i, eps in enumerate(self.epsilon):
+            if self.mode == "additive":
+                low = lower_bounds[i] if lower_bounds is not None else 0.0
+                count = int(math.floor(upper_bounds[i] / eps) - math.floor(low / eps)) + 1
+            else:
+                if lower_bounds is None:
+                    raise ValueError("lower_bounds are required in multiplicative mode")
+                low = max(lower_bounds[i], 1e-300)
+                count = (
+                    int(
+                        math.floor(math.log(upper_bounds[i]) / math.log1p(eps))
+                        - math.floor(math.log(low) / math.log1p(eps))
+                    )
+                    + 2
+                )
+            counts.append(max(1, count))
+
+        return math.prod(counts) // max(counts)
+
+    # Archive maintenance
+
+    def add(self, candidate: ArchitectureCandidate) -> bool:
+        """
+        Adds candidate if its box is not dominated by an archived box
+        Evicts members whose boxes are dominated by the candidate's box
+
+        Returns:
+            - True if candidate is added,
+            - False if candidate was rejected
+        """
+
+        candidate_box = self.box(candidate)
+
+        incumbent = self._boxes.get(candidate_box)
+
+        if incumbent is not None:
+            if dominates(incumbent, candidate):
+                return False
+
+            if not dominates(candidate, incumbent) and (
+                self._distance_to_corner(candidate, candidate_box)
+                >= self._distance_to_corner(incumbent, candidate_box)
+            ):
+                return False
+
+            self._set.remove(incumbent)
+            self._boxes[candidate_box] = candidate
+            self._set.add(candidate)
+            return True
+
+        to_remove = []
+
+        for existing_box in self._boxes:
+            if self._box_dominates(existing_box, candidate_box):
+                return False
+            if self._box_dominates(candidate_box, existing_box):
+                to_remove.append(existing_box)
+
+        for existing_box in to_remove:
+            self._set.remove(self._boxes.pop(existing_box))
+
+        self._boxes[candidate_box] = candidate
+        self._set.add(candidate)
+
+        return True
@@ -1,7 +1,15 @@
 import random
-from typing import Iterable, List, Set, Tuple
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+from typing import Callable, Iterable, List, Optional, Sequence, Set, Tuple
 
 from chatcortex.optimization.architecture_candidate import ArchitectureCandidate
+from chatcortex.optimization.vectorized import (
+    adaptive_monte_carlo_hypervolume,
+    objective_matrix,
+)
 
 
 def dominates(a: ArchitectureCandidate, b: ArchitectureCandidate) -> bool:
@@ -51,6 +59,134 @@ def compute_pareto_front(
     return pareto
 
 
+def objective_vector(candidate: ArchitectureCandidate) -> Tuple[float, float, float]:
+    """
+    (total_cost, total_latency, total_reliability) of a candidate
+    """
+
+    return (candidate.total_cost, candidate.total_latency, candidate.total_reliability)
+
+
+def pareto_filter(
+    candidates: Iterable,
+    deduplicate: bool = True,
+    key: Callable[[object], Tuple[float, float, float]] = objective_vector,
+) -> List:
+    """
+    Sorted-sweep Pareto front computation, O(n log n) comparisons
+
+    Candidates are swept in (cost asc, latency asc, reliability desc) order
+    while a 2D (latency, reliability) staircase of accepted points answers
+    "is there an earlier point at least as good" in O(log n).
+
+    deduplicate:
+        - True: keep only the first candidate per objective vector
+        - False: keep every non-dominated candidate, ties included
+          (same semantics as ParetoSet)
+
+    key:
+        Maps an item to its (cost, latency, reliability) vector
+
+    Returns survivors in their original input order
+    """
+
+    items = list(candidates)
+    vectors = [key(item) for item in items]
+
+    order = sorted(
+        range(len(items)),
+        key=lambda i: (vectors[i][0], vectors[i][1], -vectors[i][2]),
+    )
+
+    # Staircase: latency ascending, reliability strictly ascending
+    stair_latency: List[float] = []
+    stair_reliability: List[float] = []
+
+    keep = [False] * len(items)
+
+    position = 0
+    while position < len(order):
+
+        # Group identical objective vectors (adjacent after sorting)
+        vector = vectors[order[position]]
+        group_end = position + 1
+        while group_end < len(order) and vectors[order[group_end]] == vector:
+            group_end += 1
+
+        _, latency, reliability = vector
+
+        idx = bisect_right(stair_latency, latency)
+        dominated = idx > 0 and stair_reliability[idx - 1] >= reliability
+
+        if not dominated:
+            group = order[position:group_end]
+            for i in group[:1] if deduplicate else group:
+                keep[i] = True
+
+            start = bisect_left(stair_latency, latency)
+            end = start
+            while end < len(stair_latency) and stair_reliability[end] <= reliability:
+                end += 1
+
+            stair_latency[start:end] = [latency]
+            stair_reliability[start:end] = [reliability]
+
+        position = group_end
+
+    return [item for item, kept in zip(items, keep) if kept]
+
+
+def merge_pareto_fronts(
+    fronts: Iterable[Iterable[ArchitectureCandidate]],
+) -> List[ArchitectureCandidate]:
+    """
+    Merge several ParetoSets / candidate lists into one front
+
+    Single sorted sweep over the union instead of pairwise re-insertion.
+    Candidates are deduplicated by objective vector (first occurrence wins).
+    """
+
+    return pareto_filter(chain.from_iterable(fronts), deduplicate=True)
+
+
+def _merge_group(fronts: Sequence[List[ArchitectureCandidate]]) -> List[ArchitectureCandidate]:
+    return merge_pareto_fronts(fronts)
+
+
+def tree_merge_pareto_fronts(
+    fronts: Iterable[Iterable[ArchitectureCandidate]],
+    max_workers: Optional[int] = None,
+    fan_in: int = 2,
+) -> List[ArchitectureCandidate]:
+    """
+    Tree-reduction of sharded Pareto fronts across a process pool
+
+    Each round merges groups of fan_in fronts in parallel until a single
+    front remains. Groups are formed in input order, so the result is
+    deterministic and identical to merge_pareto_fronts up to ordering.
+
+    Candidates must be picklable (ArchitectureCandidate is).
+    """
+
+    if fan_in < 2:
+        raise ValueError("fan_in must be at least 2")
+
+    level = [list(front) for front in fronts]
+
+    if not level:
+        return []
+
+    if len(level) <= fan_in or max_workers == 1:
+        return merge_pareto_fronts(level)
+
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        while len(level) > 1:
+            groups = [level[i : i + fan_in] for i in range(0, len(level), fan_in)]
+            level = list(pool.map(_merge_group, groups))
+
+    return level[0]
+
+
 class ParetoSet:
     """
     Maintains a non-dominated architecture set incrementally
@@ -200,4 +336,78 @@ def hypervolume_monte_carlo(
     
     box_volume = ref_cost * ref_latency * (1.0 - ref_reliability)
 
-    return (dominated_count / num_samples) * box_volume
\ No newline at end of file
+    return (dominated_count / num_samples) * box_volume
+
+
+@dataclass(frozen=True)
+class HypervolumeEstimate:
+    """
+    Monte Carlo hypervolume estimate with its uncertainty
+
+    value: point estimate
+    standard_error: standard error of the estimate
+    confidence_interval: (low, high) at the requested confidence level
+    num_samples: samples actually drawn
+    converged: True if the tolerance was met before the sample cap
+    """
+    value: float
+    standard_error: float
+    confidence_interval: Tuple[float, float]
+    num_samples: int
+    converged: bool
+
+
+def hypervolume_monte_carlo_adaptive(
+    frontier: Iterable[ArchitectureCandidate],
+    reference_point: Tuple[float, float, float],
+    absolute_tolerance: Optional[float] = None,
+    relative_tolerance: Optional[float] = 0.01,
+    confidence: float = 0.95,
+    batch_size: int = 10000,
+    max_samples: int = 200000,
+    seed: int = 42,
+) -> HypervolumeEstimate:
+    """
+    Adaptive-precision Monte Carlo estimation of dominated hypervolume
+
+    Same sampling box as hypervolume_monte_carlo, but samples are drawn in
+    vectorized batches and the run stops as soon as the confidence
+    interval is narrower than the tolerance (or max_samples is reached).
+
+    For more than three objectives use
+    chatcortex.optimization.vectorized.adaptive_monte_carlo_hypervolume
+    directly on an (n, d) minimization matrix.
+    """
+
+    frontier = list(frontier)
+
+    if not frontier:
+        return HypervolumeEstimate(0.0, 0.0, (0.0, 0.0), 0, True)
+
+    ref_cost, ref_latency, ref_reliability = reference_point
+
+    # Minimization form: reliability r >= s  <=>  -r <= -s
+    points = objective_matrix(frontier)
+    points[:, 2] = -points[:, 2]
+
+    value, standard_error, half_width, num_samples, converged = (
+        adaptive_monte_carlo_hypervolume(
+            points,
+            lower=(0.0, 0.0, -1.0),
+            upper=(ref_cost, ref_latency, -ref_reliability),
+            absolute_tolerance=absolute_tolerance,
+            relative_tolerance=relative_tolerance,
+            confidence=confidence,
+            batch_size=batch_size,
+            max_samples=max_samples,
+            seed=seed,
+        )
+    )
+
+    return HypervolumeEstimate(
+        value=value,
+        standard_error=standard_error,
+        confidence_interval=(max(0.0, value - half_width), value + half_width),
+        num_samples=num_samples,
+        converged=converged,
+    )
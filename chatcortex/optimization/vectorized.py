@@ -0,0 +1,221 @@
+"""
+NumPy kernels for objective-space operations
+
+All matrices are (n, 3) float arrays with columns:
+    (total_cost, total_latency, total_reliability)
+
+Cost and latency are minimized, reliability is maximized.
+"""
+
+from statistics import NormalDist
+from typing import Iterable, Iterator, Optional, Sequence, Tuple
+
+import numpy as np
+
+from chatcortex.optimization.architecture_candidate import ArchitectureCandidate
+
+
+# Upper bound on elements of any intermediate boolean tensor (~4 MB)
+DEFAULT_CHUNK_ELEMENTS = 4_000_000
+
+
+def objective_matrix(candidates: Iterable[ArchitectureCandidate]) -> np.ndarray:
+    """
+    Stack candidate objectives into an (n, 3) float array
+    """
+
+    rows = [
+        (c.total_cost, c.total_latency, c.total_reliability)
+        for c in candidates
+    ]
+
+    if not rows:
+        return np.empty((0, 3), dtype=float)
+
+    return np.asarray(rows, dtype=float)
+
+
+def chunk_rows(row_width: int, max_elements: int = DEFAULT_CHUNK_ELEMENTS) -> int:
+    """
+    Rows per chunk so that chunk * row_width stays below max_elements
+    """
+
+    return max(1, max_elements // max(1, row_width))
+
+
+def iter_chunks(num_rows: int, chunk_size: int) -> Iterator[Tuple[int, int]]:
+    for start in range(0, num_rows, chunk_size):
+        yield start, min(num_rows, start + chunk_size)
+
+
+def dominance_matrix(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Boolean (len(a), len(b)) matrix: entry [i, j] is True iff a[i] dominates b[j]
+    """
+
+    if len(a) == 0 or len(b) == 0:
+        return np.zeros((len(a), len(b)), dtype=bool)
+
+    a3 = a[:, None, :]
+    b3 = b[None, :, :]
+
+    better_or_equal = (
+        (a3[..., 0] <= b3[..., 0])
+        & (a3[..., 1] <= b3[..., 1])
+        & (a3[..., 2] >= b3[..., 2])
+    )
+    strictly_better = (
+        (a3[..., 0] < b3[..., 0])
+        | (a3[..., 1] < b3[..., 1])
+        | (a3[..., 2] > b3[..., 2])
+    )
+
+    return better_or_equal & strictly_better
+
+
+def weakly_dominated_mask(
+    front: np.ndarray,
+    points: np.ndarray,
+    max_elements: int = DEFAULT_CHUNK_ELEMENTS,
+) -> np.ndarray:
+    """
+    For each point, True iff some front member is at least as good in
+    every objective. Processed in chunks of points to bound memory.
+    """
+
+    mask = np.zeros(len(points), dtype=bool)
+
+    if len(front) == 0 or len(points) == 0:
+        return mask
+
+    chunk = chunk_rows(len(front), max_elements)
+
+    for start, end in iter_chunks(len(points), chunk):
+        block = points[start:end, None, :]
+        covered = (
+            (front[None, :, 0] <= block[..., 0])
+            & (front[None, :, 1] <= block[..., 1])
+            & (front[None, :, 2] >= block[..., 2])
+        )
+        mask[start:end] = covered.any(axis=1)
+
+    return mask
+
+
+def non_dominated_mask(points: np.ndarray) -> np.ndarray:
+    """
+    Boolean mask of non-dominated rows (ties are all kept)
+
+    Iteratively removes everything dominated by the current best point,
+    O(n * front_size) vectorized comparisons.
+    """
+
+    n = len(points)
+    keep = np.ones(n, dtype=bool)
+
+    if n == 0:
+        return keep
+
+    # Points sorted by a monotone scalarization cannot be dominated by later ones
+    order = np.lexsort((-points[:, 2], points[:, 1], points[:, 0]))
+    remaining = order
+
+    while len(remaining):
+        pivot = points[remaining[0]]
+        rest = points[remaining[1:]]
+
+        dominated = (
+            (pivot[0] <= rest[:, 0])
+            & (pivot[1] <= rest[:, 1])
+            & (pivot[2] >= rest[:, 2])
+            & (
+                (pivot[0] < rest[:, 0])
+                | (pivot[1] < rest[:, 1])
+                | (pivot[2] > rest[:, 2])
+            )
+        )
+
+        keep[remaining[1:][dominated]] = False
+        remaining = remaining[1:][~dominated]
+
+    return keep
+
+
+def adaptive_monte_carlo_hypervolume(
+    points: np.ndarray,
+    lower: Sequence[float],
+    upper: Sequence[float],
+    absolute_tolerance: Optional[float] = None,
+    relative_tolerance: Optional[float] = 0.01,
+    confidence: float = 0.95,
+    batch_size: int = 10000,
+    min_samples: Optional[int] = None,
+    max_samples: int = 200000,
+    seed: int = 42,
+) -> Tuple[float, float, float, int, bool]:
+    """
+    Monte Carlo hypervolume in any number of (minimized) objectives
+
+    Uniform samples from the box [lower, upper] are drawn in vectorized
+    batches until the confidence-interval half-width drops below
+    max(absolute_tolerance, relative_tolerance * estimate) or max_samples
+    is reached.
+
+    The standard error uses the add-one (Agresti-Coull style) proportion
+    (hits + 1) / (n + 2), so an all-miss or all-hit prefix cannot stop the
+    run with a zero-width interval.
+
+    Returns:
+        (estimate, standard_error, half_width, num_samples, converged)
+    """
+
+    if absolute_tolerance is None and relative_tolerance is None:
+        raise ValueError("At least one of absolute_tolerance / relative_tolerance is required")
+
+    if not 0.0 < confidence < 1.0:
+        raise ValueError("confidence must be in (0, 1)")
+
+    lower = np.asarray(lower, dtype=float)
+    upper = np.asarray(upper, dtype=float)
+    box_volume = float(np.prod(upper - lower))
+
+    min_samples = batch_size if min_samples is None else min_samples
+    z = NormalDist().inv_cdf(0.5 + confidence / 2.0)
+
+    random_number_generator = np.random.default_rng(seed)
+
+    hits = 0
+    num_samples = 0
+    estimate = standard_error = half_width = 0.0
+    converged = False
+
+    while num_samples < max_samples:
+        size = min(batch_size, max_samples - num_samples)
+        samples = lower + (upper - lower) * random_number_generator.random((size, len(lower)))
+
+        if len(points):
+            covered = np.zeros(size, dtype=bool)
+            chunk = chunk_rows(len(points))
+            for start, end in iter_chunks(size, chunk):
+                covered[start:end] = (
+                    points[None, :, :] <= samples[start:end, None, :]
+                ).all(axis=2).any(axis=1)
+            hits += int(covered.sum())
+
+        num_samples += size
+
+        estimate = box_volume * hits / num_samples
+        smoothed = (hits + 1) / (num_samples + 2)
+        standard_error = box_volume * float(np.sqrt(smoothed * (1.0 - smoothed) / num_samples))
+        half_width = z * standard_error
+
+        if num_samples >= min_samples:
+            target = max(
+                absolute_tolerance or 0.0,
+                (relative_tolerance or 0.0) * estimate,
+            )
+            if half_width <= target:
+                converged = True
+                break
+
+    return estimate, standard_error, half_width, num_samples, converged
@@ -6,10 +6,26 @@
 
 
 # Simple in-memory registration for v0.2.0
-from typing import Optional, List
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, Optional, List, Set, Tuple
 from .metadata import ComponentMetadata, PrivacyLevel
 
 
+@dataclass
+class RegistryDelta:
+    """
+    Batch of registry changes
+
+    added: new components
+    removed: names of registered components to drop
+    changed: new metadata for registered components (matched by name)
+    """
+
+    added: List[ComponentMetadata] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    changed: List[ComponentMetadata] = field(default_factory=list)
+
+
 class CapabilityRegistry:
     """
     In-memory registry of agent components.
@@ -18,10 +34,14 @@ class CapabilityRegistry:
     - Storing component metadata
     - Filtering candidates by capability
     - Applying hard constraints like privacy_level
+
+    version is bumped on every change, so caches derived from the
+    registry contents can detect staleness
     """
 
     def __init__(self):
         self._components: dict[str, ComponentMetadata] = {}
+        self.version = 0
     
     # Registration
 
@@ -29,6 +49,49 @@ class CapabilityRegistry:
         if metadata.name in self._components:
             raise ValueError(f"Component '{metadata.name}' already registered.")
         self._components[metadata.name] = metadata
+        self.version += 1
+
+    def unregister(self, name: str) -> ComponentMetadata:
+        if name not in self._components:
+            raise ValueError(f"Component '{name}' is not registered.")
+        self.version += 1
+        return self._components.pop(name)
+
+    def update(self, metadata: ComponentMetadata) -> ComponentMetadata:
+        """
+        Replace a registered component, keeping its registration order
+        """
+
+        if metadata.name not in self._components:
+            raise ValueError(f"Component '{metadata.name}' is not registered.")
+        previous = self._components[metadata.name]
+        self._components[metadata.name] = metadata
+        self.version += 1
+        return previous
+
+    def apply(self, delta: RegistryDelta) -> Set[str]:
+        """
+        Apply a delta (removals, then changes, then additions)
+
+        Returns the capabilities whose candidate lists may have changed,
+        covering both the old and the new metadata of every touched
+        component
+        """
+
+        affected: Set[str] = set()
+
+        for name in delta.removed:
+            affected.update(self.unregister(name).capabilities)
+
+        for metadata in delta.changed:
+            affected.update(self.update(metadata).capabilities)
+            affected.update(metadata.capabilities)
+
+        for metadata in delta.added:
+            self.register(metadata)
+            affected.update(metadata.capabilities)
+
+        return affected
     
     def get(self, name: str) -> ComponentMetadata:
         return self._components[name]
@@ -59,4 +122,81 @@ class CapabilityRegistry:
                 if candidate.privacy_level == privacy_constraint
             ]
         
-        return candidates
\ No newline at end of file
+        return candidates
+
+
+class CachedCapabilityRegistry(CapabilityRegistry):
+    """
+    Read-through view of a registry that memoizes capability lookups
+
+    Lookups and values derived from the registry contents (see memoize)
+    are shared by every caller of the view and dropped as soon as the
+    underlying registry version changes. Changes made through the view
+    are applied to the underlying registry.
+
+    get_by_capability returns a fresh list per call, so callers may
+    modify it.
+    """
+
+    def __init__(self, registry: CapabilityRegistry):
+        self.registry = registry
+        self.hits = 0
+        self.misses = 0
+
+        self._cached_version = registry.version
+        self._lookups: Dict[Tuple[str, Optional[PrivacyLevel]], List[ComponentMetadata]] = {}
+        self._derived: Dict[Hashable, Any] = {}
+
+    @property
+    def _components(self) -> Dict[str, ComponentMetadata]:
+        return self.registry._components
+
+    @property
+    def version(self) -> int:
+        return self.registry.version
+
+    @version.setter
+    def version(self, value: int) -> None:
+        self.registry.version = value
+
+    def _sync(self) -> None:
+        if self._cached_version != self.registry.version:
+            self._lookups.clear()
+            self._derived.clear()
+            self._cached_version = self.registry.version
+
+    def get_by_capability(
+        self,
+        capability: str,
+        privacy_constraint: Optional[PrivacyLevel] = None,
+    ) -> List[ComponentMetadata]:
+
+        self._sync()
+        key = (capability, privacy_constraint)
+        candidates = self._lookups.get(key)
+
+        if candidates is None:
+            self.misses += 1
+            candidates = self._lookups[key] = super().get_by_capability(
+                capability, privacy_constraint
+            )
+        else:
+            self.hits += 1
+
+        return list(candidates)
+
+    def memoize(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """
+        Value derived from the current registry contents, built once
+        per registry version
+        """
+
+        self._sync()
+
+        if key not in self._derived:
+            self.misses += 1
+            self._derived[key] = factory()
+        else:
+            self.hits += 1
+
+        return self._derived[key]
@@ -1,12 +1,38 @@
+import asyncio
+import time
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import AsyncIterator, Callable, Iterator, List, Optional, Set
 
+from chatcortex.evaluation.evaluator import Evaluator
 from chatcortex.optimization.architecture_candidate import ArchitectureCandidate
+from chatcortex.optimization.pareto import ParetoSet
 from chatcortex.registry.capability_registry import CapabilityRegistry
-from chatcortex.synthesis.budget import SynthesisBudget
+from chatcortex.synthesis.budget import SynthesisBudget, SynthesisContext
 from chatcortex.synthesis.task_specification import TaskSpecification
 
 
+@dataclass
+class FrontierDelta:
+    """
+    Frontier change reported by Synthesizer.stream()
+
+    inserted / evicted: candidates that entered / left the archive since
+                        the previous delta
+    evaluations: evaluations spent so far (None if the synthesizer does
+                 not stream and only reports its final result)
+    elapsed: seconds since the search started
+    done: True for the last delta of a completed search
+    """
+
+    inserted: List[ArchitectureCandidate]
+    evicted: List[ArchitectureCandidate]
+    evaluations: Optional[int]
+    elapsed: float
+    done: bool = False
+
+
 class Synthesizer(ABC):
     """
     Abstract Base Class for all synthesis strategies
@@ -18,10 +44,135 @@ class Synthesizer(ABC):
         - Task Specification defines constraints and objectives
         - SynthesisBudget constrains computational resources
         - Output is a list of ArchitectureCandidate objects
+
+    archive_factory:
+        Zero-argument callable building the final Pareto archive.
+        Defaults to the exact ParetoSet, pass e.g. an EpsilonParetoSet
+        factory to bound memory on long runs
+
+    evaluator:
+        Optional Evaluator scoring complete architectures in batches
+        instead of the static metric sums. Budget is counted per
+        architecture submitted to it
     """
 
-    def __init__(self, registry: CapabilityRegistry):
+    def __init__(
+        self,
+        registry: CapabilityRegistry,
+        archive_factory: Optional[Callable[[], ParetoSet]] = None,
+        evaluator: Optional[Evaluator] = None,
+    ):
         self.registry = registry
+        self.archive_factory = archive_factory or ParetoSet
+        self.evaluator = evaluator
+
+    def _new_archive(self) -> ParetoSet:
+        return self.archive_factory()
+
+    def _search(
+        self,
+        task: TaskSpecification,
+        budget: Optional[SynthesisBudget],
+        context: SynthesisContext,
+        archive: ParetoSet,
+    ) -> Optional[Iterator[bool]]:
+        """
+        Incremental search hook used by stream()
+
+        Returns a generator that fills archive under context and yields
+        after every evaluation whether the archive changed, or None if
+        the synthesizer (in its current configuration) cannot stream.
+        """
+        return None
+
+    def stream(
+        self,
+        task: TaskSpecification,
+        budget: Optional[SynthesisBudget] = None,
+        report_every: Optional[int] = None,
+    ) -> Iterator[FrontierDelta]:
+        """
+        Anytime variant of synthesize()
+
+        Yields a FrontierDelta as soon as the archive changes, and at
+        least every report_every evaluations if set (heartbeat, possibly
+        empty). The last delta has done=True. Closing the generator (e.g.
+        breaking out of the loop) stops the search.
+
+        Synthesizers without incremental support run synthesize() and
+        yield a single final delta.
+        """
+
+        task.validate()
+
+        context = SynthesisContext(budget)
+        archive = self._new_archive()
+        steps = self._search(task, budget, context, archive)
+
+        if steps is None:
+            frontier = self.synthesize(task, budget)
+            yield FrontierDelta(
+                inserted=list(frontier),
+                evicted=[],
+                evaluations=None,
+                elapsed=time.time() - context.start_time,
+                done=True,
+            )
+            return
+
+        published: Set[ArchitectureCandidate] = set()
+        last_report = 0
+
+        def delta(done: bool) -> FrontierDelta:
+            current = set(archive)
+            inserted = [c for c in current if c not in published]
+            evicted = [c for c in published if c not in current]
+            published.clear()
+            published.update(current)
+
+            return FrontierDelta(
+                inserted=inserted,
+                evicted=evicted,
+                evaluations=context.evaluations,
+                elapsed=time.time() - context.start_time,
+                done=done,
+            )
+
+        for changed in steps:
+            heartbeat = (
+                report_every is not None
+                and context.evaluations - last_report >= report_every
+            )
+
+            if changed or heartbeat:
+                last_report = context.evaluations
+                yield delta(done=False)
+
+        yield delta(done=True)
+
+    async def astream(
+        self,
+        task: TaskSpecification,
+        budget: Optional[SynthesisBudget] = None,
+        report_every: Optional[int] = None,
+    ) -> AsyncIterator[FrontierDelta]:
+        """
+        Async iterator over stream(), searching in a worker thread so the
+        event loop stays responsive
+        """
+
+        loop = asyncio.get_running_loop()
+        steps = self.stream(task, budget, report_every)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            try:
+                while True:
+                    delta = await loop.run_in_executor(executor, next, steps, None)
+                    if delta is None:
+                        return
+                    yield delta
+            finally:
+                await loop.run_in_executor(executor, steps.close)
     
     @abstractmethod
     def synthesize(
@@ -0,0 +1,327 @@
+import time
+from dataclasses import dataclass
+from typing import Callable, Iterator, List, Optional, Sequence
+
+import numpy as np
+
+from chatcortex.optimization.architecture_candidate import ArchitectureCandidate
+from chatcortex.optimization.pareto import ParetoSet
+from chatcortex.optimization.vectorized import objective_matrix, weakly_dominated_mask
+from chatcortex.registry.capability_registry import CachedCapabilityRegistry, CapabilityRegistry
+from chatcortex.synthesis.base import Synthesizer
+from chatcortex.synthesis.budget import SynthesisBudget, SynthesisContext
+from chatcortex.synthesis.search_space import ChainSearchSpace
+from chatcortex.synthesis.task_specification import TaskSpecification
+
+
+class _TaskContext(SynthesisContext):
+    """
+    Per-task context charging every evaluation to a shared batch context
+
+    Limits are those of the shared context, so an evaluator batch never
+    overshoots the global budget.
+    """
+
+    def __init__(self, shared: SynthesisContext):
+        super().__init__(shared.budget)
+        self.shared = shared
+        self.start_time = shared.start_time
+
+    def _check_evaluation_limit(self):
+        self.shared._check_evaluation_limit()
+
+    def _check_time_limit(self):
+        self.shared._check_time_limit()
+
+    def register_evaluation(self):
+        self.shared.register_evaluation()
+        self.evaluations += 1
+
+
+@dataclass
+class TaskProgress:
+    """
+    Outcome of one task of a batch
+
+    evaluations: evaluations charged to the task
+    hypervolume: fraction of the task's reference box dominated by the
+                 frontier (Monte Carlo, fixed samples)
+    slices: scheduling slices the task received
+    exhausted: True if the task's search ended (completed, or stopped
+               by the global budget)
+    """
+
+    task: TaskSpecification
+    frontier: List[ArchitectureCandidate]
+    evaluations: int
+    hypervolume: float
+    slices: int
+    exhausted: bool
+
+
+@dataclass
+class BatchSynthesisResult:
+    tasks: List[TaskProgress]
+    evaluations: int
+    elapsed: float
+
+    @property
+    def frontiers(self) -> List[List[ArchitectureCandidate]]:
+        return [progress.frontier for progress in self.tasks]
+
+
+class _TaskRun:
+    """
+    Scheduling state of one task
+    """
+
+    def __init__(
+        self,
+        task: TaskSpecification,
+        space: ChainSearchSpace,
+        archive: ParetoSet,
+        context: _TaskContext,
+        steps: Optional[Iterator[bool]],
+        samples: np.ndarray,
+    ):
+        self.task = task
+        self.space = space
+        self.archive = archive
+        self.context = context
+        self.steps = steps
+        self.samples = samples
+        self.covered = np.zeros(len(samples), dtype=bool)
+        self.frontier: List[ArchitectureCandidate] = []
+        self.charged = 0
+        self.slices = 0
+        self.rate = np.inf
+        self.exhausted = steps is None
+
+    @property
+    def evaluations(self) -> int:
+        return self.charged + self.context.evaluations
+
+    @property
+    def hypervolume(self) -> float:
+        return float(self.covered.mean()) if len(self.covered) else 0.0
+
+    def update_hypervolume(self, frontier: Sequence[ArchitectureCandidate]) -> float:
+        """
+        Record the frontier and return the hypervolume gained
+
+        Samples only ever become covered, so the estimate is monotone for
+        archives that only replace members by dominating ones.
+        """
+
+        self.frontier = list(frontier)
+        before = self.hypervolume
+
+        if self.frontier and not self.covered.all():
+            points = objective_matrix(self.frontier)
+            open_samples = np.flatnonzero(~self.covered)
+            self.covered[open_samples] = weakly_dominated_mask(points, self.samples[open_samples])
+
+        return self.hypervolume - before
+
+
+class BatchSynthesizer:
+    """
+    Synthesis of many tasks under one global budget
+
+    synthesizer_factory:
+        Builds the synthesizer from a registry, e.g. ExhaustiveSynthesizer
+        or lambda registry: RandomSynthesizer(registry, seed=1). It
+        receives a CachedCapabilityRegistry view, so capability lookups
+        and search spaces are computed once and shared by all tasks.
+
+    Scheduling:
+        Tasks whose synthesizer streams (see Synthesizer.stream) are
+        advanced in slices of slice_evaluations evaluations. Every task
+        gets one slice first, then each slice goes to the task with the
+        highest hypervolume gain per evaluation over its last slice (ties:
+        fewest evaluations so far), until the budget runs out or every
+        search completes. Stalled tasks are resumed once every other task
+        has stalled as well.
+
+        Hypervolume is the fraction of hypervolume_samples fixed uniform
+        samples dominated by the task frontier, in the box between the
+        ideal point of the task's search space and its reference point
+        (task constraints, or the worst architecture), so gains are
+        comparable across tasks.
+
+        Tasks whose synthesizer cannot stream run synthesize() once, up
+        front, with an equal share of the budget. They are charged their
+        full share, since the spent evaluations are not reported.
+
+    Budget:
+        max_evaluations and max_time_seconds apply to the whole batch.
+        random_seed is passed to every task. Without a budget, searches
+        that never complete on their own (e.g. random sampling) do not
+        terminate.
+    """
+
+    def __init__(
+        self,
+        synthesizer_factory: Callable[[CapabilityRegistry], Synthesizer],
+        registry: CapabilityRegistry,
+        slice_evaluations: int = 64,
+        hypervolume_samples: int = 4096,
+        seed: int = 42,
+    ):
+        if slice_evaluations < 1:
+            raise ValueError("slice_evaluations must be positive")
+
+        if hypervolume_samples < 1:
+            raise ValueError("hypervolume_samples must be positive")
+
+        self.registry = CachedCapabilityRegistry(registry)
+        self.synthesizer = synthesizer_factory(self.registry)
+        self.slice_evaluations = slice_evaluations
+        self.hypervolume_samples = hypervolume_samples
+        self.seed = seed
+
+    def _samples(self, task: TaskSpecification, space: ChainSearchSpace) -> np.ndarray:
+        """
+        Uniform samples between the ideal and the reference point
+        """
+
+        if space.is_empty:
+            return np.zeros((0, 3))
+
+        worst_cost = sum(max(costs) for costs in space.costs)
+        worst_latency = sum(max(latencies) for latencies in space.latencies)
+
+        lower = np.array([
+            space.min_remaining_cost[0],
+            space.min_remaining_latency[0],
+            0.0,
+        ])
+        upper = np.array([
+            worst_cost if task.max_cost is None else min(worst_cost, task.max_cost),
+            worst_latency if task.max_latency is None else min(worst_latency, task.max_latency),
+            space.max_remaining_reliability[0],
+        ])
+
+        rng = np.random.default_rng(self.seed)
+        return rng.uniform(lower, np.maximum(lower, upper), size=(self.hypervolume_samples, 3))
+
+    def synthesize(
+        self,
+        tasks: Sequence[TaskSpecification],
+        budget: Optional[SynthesisBudget] = None,
+    ) -> BatchSynthesisResult:
+
+        for task in tasks:
+            task.validate()
+
+        shared = SynthesisContext(budget)
+        runs: List[_TaskRun] = []
+
+        for task in tasks:
+            space = ChainSearchSpace.from_task(self.registry, task)
+            context = _TaskContext(shared)
+            archive = self.synthesizer._new_archive()
+
+            runs.append(
+                _TaskRun(
+                    task=task,
+                    space=space,
+                    archive=archive,
+                    context=context,
+                    steps=self.synthesizer._search(task, budget, context, archive),
+                    samples=self._samples(task, space),
+                )
+            )
+
+        self._run_fixed_shares(runs, shared, budget)
+
+        streaming = [run for run in runs if run.steps is not None]
+
+        # Unscheduled tasks have an infinite rate, so every task gets a
+        # first slice before gains are compared
+        while shared.can_evaluate():
+            pending = [run for run in streaming if not run.exhausted]
+
+            if not pending:
+                break
+
+            self._advance(max(pending, key=lambda run: (run.rate, -run.evaluations)), shared)
+
+        for run in streaming:
+            run.steps.close()
+            run.update_hypervolume(list(run.archive))
+
+        return BatchSynthesisResult(
+            tasks=[
+                TaskProgress(
+                    task=run.task,
+                    frontier=run.frontier,
+                    evaluations=run.evaluations,
+                    hypervolume=run.hypervolume,
+                    slices=run.slices,
+                    exhausted=run.exhausted,
+                )
+                for run in runs
+            ],
+            evaluations=sum(run.evaluations for run in runs),
+            elapsed=time.time() - shared.start_time,
+        )
+
+    def _run_fixed_shares(
+        self,
+        runs: List[_TaskRun],
+        shared: SynthesisContext,
+        budget: Optional[SynthesisBudget],
+    ) -> None:
+        """
+        Run tasks that cannot stream with an equal share of the budget
+        """
+
+        fixed = [run for run in runs if run.steps is None]
+
+        for position, run in enumerate(fixed):
+            remaining_tasks = len(runs) - position
+            max_evaluations = max_time_seconds = None
+            random_seed = budget.random_seed if budget else None
+
+            if budget is not None and budget.max_evaluations is not None:
+                max_evaluations = (budget.max_evaluations - shared.evaluations) // remaining_tasks
+
+            if budget is not None and budget.max_time_seconds is not None:
+                elapsed = time.time() - shared.start_time
+                max_time_seconds = max(0.0, budget.max_time_seconds - elapsed) / remaining_tasks
+
+            frontier = self.synthesizer.synthesize(
+                run.task,
+                SynthesisBudget(max_evaluations, max_time_seconds, random_seed),
+            )
+
+            if max_evaluations is not None:
+                run.charged = max_evaluations
+                shared.evaluations += max_evaluations
+
+            run.slices = 1
+            run.update_hypervolume(frontier)
+
+    def _advance(self, run: _TaskRun, shared: SynthesisContext) -> None:
+        """
+        Give one slice of evaluations to a task
+        """
+
+        start = run.context.evaluations
+
+        try:
+            while run.context.evaluations - start < self.slice_evaluations and shared.can_evaluate():
+                next(run.steps)
+        except StopIteration:
+            run.exhausted = True
+
+        spent = run.context.evaluations - start
+        gain = run.update_hypervolume(list(run.archive))
+
+        run.slices += 1
+        run.rate = gain / max(spent, 1)
+
+        if spent == 0 and shared.can_evaluate():
+            # Defensive: a search that makes no progress is done
+            run.exhausted = True
@@ -0,0 +1,386 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, List, Optional, Sequence, Tuple
+
+from chatcortex.evaluation.evaluator import Evaluator
+from chatcortex.optimization.pareto import ParetoSet, pareto_filter
+from chatcortex.registry.metadata import ComponentMetadata
+from chatcortex.synthesis.budget import BudgetExceeded, SynthesisContext
+from chatcortex.synthesis.search_space import BOUND_SLACK, ChainSearchSpace
+from chatcortex.synthesis.task_specification import TaskSpecification
+
+
+class PrefixState:
+    """
+    Compact partial architecture tracked by the beam engine
+
+    indices: component index per completed stage
+    total_*: running metrics, accumulated in AgentGraph order
+    score: running sum of per-component scores (0.0 if unused)
+
+    Exposes the ArchitectureCandidate metric attributes, so dominance,
+    ParetoSet and the existing truncation helpers work on it directly.
+    Equality is identity-based, like candidates holding distinct graphs.
+    """
+
+    __slots__ = ("indices", "total_cost", "total_latency", "total_reliability", "score")
+
+    def __init__(
+        self,
+        indices: Tuple[int, ...],
+        total_cost: float,
+        total_latency: float,
+        total_reliability: float,
+        score: float = 0.0,
+    ):
+        self.indices = indices
+        self.total_cost = total_cost
+        self.total_latency = total_latency
+        self.total_reliability = total_reliability
+        self.score = score
+
+    def __repr__(self) -> str:
+        return (
+            f"PrefixState(indices={self.indices!r}, cost={self.total_cost!r}, "
+            f"latency={self.total_latency!r}, reliability={self.total_reliability!r})"
+        )
+
+
+ROOT_STATE = PrefixState((), 0.0, 0.0, 1.0, 0.0)
+
+# rank(children) -> ordered / filtered stage pool
+RankStrategy = Callable[[List[PrefixState]], List[PrefixState]]
+
+# truncate(ranked, stage_idx) -> beam carried to the next stage
+TruncateStrategy = Callable[[List[PrefixState], int], List[PrefixState]]
+
+
+def rank_by_score(states: List[PrefixState]) -> List[PrefixState]:
+    """
+    Stable ascending sort by cumulative component score
+    """
+    return sorted(states, key=lambda state: state.score)
+
+
+def rank_by_key(key: Callable[[PrefixState], float]) -> RankStrategy:
+    """
+    Stable ascending sort by an arbitrary state key
+    """
+
+    def rank(states: List[PrefixState]) -> List[PrefixState]:
+        return sorted(states, key=key)
+
+    return rank
+
+
+def rank_pareto(states: List[PrefixState]) -> List[PrefixState]:
+    """
+    Non-dominated prefixes (ties kept) in expansion order
+    """
+    return pareto_filter(states, deduplicate=False)
+
+
+def expand_states(
+    beam: Sequence[PrefixState],
+    costs: Sequence[float],
+    latencies: Sequence[float],
+    reliabilities: Sequence[float],
+    stage_scores: Sequence[float],
+    max_cost: Optional[float] = None,
+    max_latency: Optional[float] = None,
+) -> List[PrefixState]:
+    """
+    Extend every beam state by every stage component, in beam order
+
+    Children whose running cost / latency exceed max_cost / max_latency
+    are dropped.
+    """
+
+    children = []
+
+    for state in beam:
+        for idx in range(len(costs)):
+            cost = state.total_cost + costs[idx]
+            latency = state.total_latency + latencies[idx]
+
+            if max_cost is not None and cost > max_cost:
+                continue
+            if max_latency is not None and latency > max_latency:
+                continue
+
+            children.append(
+                PrefixState(
+                    state.indices + (idx,),
+                    cost,
+                    latency,
+                    state.total_reliability * reliabilities[idx],
+                    state.score + stage_scores[idx],
+                )
+            )
+
+    return children
+
+
+def _expand_shard(
+    shard: Sequence[PrefixState],
+    costs: Sequence[float],
+    latencies: Sequence[float],
+    reliabilities: Sequence[float],
+    stage_scores: Sequence[float],
+    max_cost: Optional[float],
+    max_latency: Optional[float],
+    pareto: bool,
+) -> List[PrefixState]:
+    """
+    Worker: expand one contiguous beam shard, optionally Pareto-filtered
+    """
+
+    children = expand_states(
+        shard, costs, latencies, reliabilities, stage_scores, max_cost, max_latency
+    )
+
+    if pareto:
+        children = rank_pareto(children)
+
+    return children
+
+
+def keep_top(width: int) -> TruncateStrategy:
+    def truncate(states: List[PrefixState], stage_idx: int) -> List[PrefixState]:
+        return states[:width]
+
+    return truncate
+
+
+class BeamEngine:
+    """
+    Shared prefix-state beam search over a ChainSearchSpace
+
+    Per stage:
+        1. expand every beam state by every stage component, updating
+           running cost / latency / reliability / score in O(1)
+        2. rank the children (sort, Pareto filter, ...)
+        3. truncate to the beam for the next stage (not after the last)
+
+    Registry lookups happen once per stage (via the search space) and
+    AgentGraphs are built only for feasible final architectures.
+
+    num_workers:
+        If > 1, each stage's beam is split into contiguous shards that are
+        expanded in worker processes (and Pareto-filtered per shard when
+        ranking with rank_pareto). Shard results are concatenated in beam
+        order before the usual rank / truncate step, so results match
+        serial mode exactly.
+
+    prune_infeasible:
+        If a task is given, drop prefixes whose running cost / latency plus
+        the cheapest completion of the remaining stages already violates
+        max_cost / max_latency, before they take up beam slots.
+
+    evaluator:
+        If set, final states are scored in one batch by the Evaluator
+        (prefixes are still ranked on the static metrics) and feasibility
+        is checked on the evaluated objectives.
+    """
+
+    def __init__(
+        self,
+        rank: RankStrategy,
+        truncate: TruncateStrategy,
+        component_score: Optional[Callable[[ComponentMetadata], float]] = None,
+        num_workers: Optional[int] = None,
+        shards_per_worker: int = 2,
+        prune_infeasible: bool = True,
+        evaluator: Optional[Evaluator] = None,
+    ):
+        self.rank = rank
+        self.truncate = truncate
+        self.component_score = component_score
+        self.num_workers = num_workers
+        self.shards_per_worker = shards_per_worker
+        self.prune_infeasible = prune_infeasible
+        self.evaluator = evaluator
+
+    def _stage_scores(self, space: ChainSearchSpace, stage_idx: int) -> Sequence[float]:
+        if self.component_score is None:
+            return [0.0] * space.radices[stage_idx]
+
+        return [
+            self.component_score(component)
+            for component in space.stage_candidates[stage_idx]
+        ]
+
+    def _stage_limits(
+        self,
+        space: ChainSearchSpace,
+        stage_idx: int,
+        task: Optional[TaskSpecification],
+    ) -> Tuple[Optional[float], Optional[float]]:
+        """
+        Largest running cost / latency a prefix ending at stage_idx may
+        have and still admit a feasible completion
+        """
+
+        if task is None or not self.prune_infeasible:
+            return None, None
+
+        max_cost = max_latency = None
+
+        if task.max_cost is not None:
+            max_cost = (
+                task.max_cost * (1.0 + BOUND_SLACK) - space.min_remaining_cost[stage_idx + 1]
+            )
+        if task.max_latency is not None:
+            max_latency = (
+                task.max_latency * (1.0 + BOUND_SLACK) - space.min_remaining_latency[stage_idx + 1]
+            )
+
+        return max_cost, max_latency
+
+    def expand(
+        self,
+        beam: Sequence[PrefixState],
+        space: ChainSearchSpace,
+        stage_idx: int,
+        stage_scores: Sequence[float],
+        pool: Optional[ProcessPoolExecutor] = None,
+        task: Optional[TaskSpecification] = None,
+    ) -> List[PrefixState]:
+
+        stage_metrics = (
+            space.costs[stage_idx],
+            space.latencies[stage_idx],
+            space.reliabilities[stage_idx],
+            stage_scores,
+            *self._stage_limits(space, stage_idx, task),
+        )
+
+        if pool is None or len(beam) < 2:
+            return expand_states(beam, *stage_metrics)
+
+        # Contiguous shards keep expansion order. A per-shard Pareto filter
+        # only drops children the global filter would drop as well, so the
+        # final rank is identical to serial mode.
+        num_shards = min(len(beam), self.num_workers * self.shards_per_worker)
+        bounds = [len(beam) * i // num_shards for i in range(num_shards + 1)]
+        shard_pareto = self.rank is rank_pareto
+
+        futures = [
+            pool.submit(
+                _expand_shard,
+                beam[bounds[i] : bounds[i + 1]],
+                *stage_metrics,
+                shard_pareto,
+            )
+            for i in range(num_shards)
+        ]
+
+        return [child for future in futures for child in future.result()]
+
+    def search(
+        self,
+        space: ChainSearchSpace,
+        task: Optional[TaskSpecification] = None,
+    ) -> List[PrefixState]:
+        """
+        Run all stages and return the ranked final states
+
+        task enables feasibility pruning (see prune_infeasible)
+        """
+
+        if space.is_empty:
+            return []
+
+        beam: List[PrefixState] = [ROOT_STATE]
+
+        pool = None
+        if self.num_workers is not None and self.num_workers > 1:
+            pool = ProcessPoolExecutor(max_workers=self.num_workers)
+
+        try:
+            for stage_idx in range(space.num_stages):
+
+                children = self.expand(
+                    beam,
+                    space,
+                    stage_idx,
+                    self._stage_scores(space, stage_idx),
+                    pool,
+                    task,
+                )
+                ranked = self.rank(children)
+
+                if stage_idx < space.num_stages - 1:
+                    beam = self.truncate(ranked, stage_idx)
+                else:
+                    beam = ranked # Keep all final candidates
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
+        return beam
+
+    def finalize(
+        self,
+        states: Sequence[PrefixState],
+        space: ChainSearchSpace,
+        task: TaskSpecification,
+        context: SynthesisContext,
+        archive: ParetoSet,
+    ) -> ParetoSet:
+        """
+        Evaluate final states in order under the budget and archive the
+        feasible ones
+        """
+
+        if self.evaluator is not None:
+            return self._finalize_evaluated(states, space, task, context, archive)
+
+        for state in states:
+
+            try:
+                context.register_evaluation()
+            except BudgetExceeded:
+                break
+
+            if not space.is_feasible(task, state.total_cost, state.total_latency):
+                continue
+
+            archive.add(
+                space.to_candidate(
+                    state.indices,
+                    (state.total_cost, state.total_latency, state.total_reliability),
+                )
+            )
+
+        return archive
+
+    def _finalize_evaluated(
+        self,
+        states: Sequence[PrefixState],
+        space: ChainSearchSpace,
+        task: TaskSpecification,
+        context: SynthesisContext,
+        archive: ParetoSet,
+    ) -> ParetoSet:
+
+        evaluated = self.evaluator.evaluate_batch(
+            [space.components(state.indices) for state in states], context
+        )
+
+        for state, objectives in zip(states, evaluated):
+
+            if objectives is None or not space.is_feasible(task, objectives[0], objectives[1]):
+                continue
+
+            archive.add(space.to_candidate(state.indices, objectives))
+
+        return archive
+
+    def run(
+        self,
+        space: ChainSearchSpace,
+        task: TaskSpecification,
+        context: SynthesisContext,
+        archive: ParetoSet,
+    ) -> ParetoSet:
+        return self.finalize(self.search(space, task), space, task, context, archive)
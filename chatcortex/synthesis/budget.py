@@ -51,6 +51,13 @@ class SynthesisContext:
         ):
             raise BudgetExceeded("Maximum time budget reached")
     
+    def within_time_limit(self) -> bool:
+        try:
+            self._check_time_limit()
+            return True
+        except BudgetExceeded:
+            return False
+
     def can_evaluate(self) -> bool:
         try:
             self._check_evaluation_limit()
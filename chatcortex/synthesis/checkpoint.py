@@ -0,0 +1,112 @@
+import json
+import os
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Iterable, List, Optional
+
+from chatcortex.optimization.architecture_candidate import CompactCandidate
+from chatcortex.optimization.pareto import ParetoSet
+from chatcortex.registry.capability_registry import CapabilityRegistry
+from chatcortex.synthesis.search_space import ChainSearchSpace
+from chatcortex.synthesis.task_specification import TaskSpecification
+
+
+CHECKPOINT_FORMAT = 1
+
+
+@dataclass
+class SearchCheckpoint:
+    """
+    Serializable progress of a synthesis run
+
+    synthesizer: class name of the synthesizer that wrote it
+    stages: component names per stage, in search space order, to detect
+            registry changes that would invalidate cursor / RNG state
+    evaluations: evaluations spent so far (over all resumed runs)
+    archive: Pareto archive as compact candidates
+    cursor: next architecture index (enumerating synthesizers)
+    rng_state: random generator state (sampling synthesizers)
+    """
+
+    synthesizer: str
+    task: TaskSpecification
+    stages: List[List[str]]
+    evaluations: int
+    archive: List[CompactCandidate] = field(default_factory=list)
+    cursor: Optional[int] = None
+    rng_state: Optional[Any] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "format": CHECKPOINT_FORMAT,
+            "synthesizer": self.synthesizer,
+            "task": asdict(self.task),
+            "stages": self.stages,
+            "evaluations": self.evaluations,
+            "cursor": self.cursor,
+            "rng_state": self.rng_state,
+            "archive": [
+                [list(c.architecture_key), list(c.objectives)] for c in self.archive
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SearchCheckpoint":
+        if data.get("format") != CHECKPOINT_FORMAT:
+            raise ValueError(f"Unsupported checkpoint format: {data.get('format')}")
+
+        return cls(
+            synthesizer=data["synthesizer"],
+            task=TaskSpecification(**data["task"]),
+            stages=data["stages"],
+            evaluations=data["evaluations"],
+            cursor=data.get("cursor"),
+            rng_state=data.get("rng_state"),
+            archive=[
+                CompactCandidate(key, objectives) for key, objectives in data["archive"]
+            ],
+        )
+
+    def check_space(self, space: ChainSearchSpace) -> None:
+        """
+        Raise ValueError if the search space no longer matches the run
+        """
+
+        if stage_names(space) != self.stages:
+            raise ValueError(
+                "Registry candidates changed since the checkpoint was written"
+            )
+
+    def restore_archive(self, registry: CapabilityRegistry, archive: ParetoSet) -> ParetoSet:
+        for candidate in self.archive:
+            archive.add(candidate.materialize(registry))
+        return archive
+
+
+def stage_names(space: ChainSearchSpace) -> List[List[str]]:
+    return [[c.name for c in candidates] for candidates in space.stage_candidates]
+
+
+def compact_archive(archive: Iterable) -> List[CompactCandidate]:
+    return [
+        candidate if isinstance(candidate, CompactCandidate) else candidate.to_compact()
+        for candidate in archive
+    ]
+
+
+def save_checkpoint(path: str, checkpoint: SearchCheckpoint) -> None:
+    """
+    Write a checkpoint atomically (temporary file + rename), so a run
+    killed while writing leaves the previous checkpoint intact
+    """
+
+    tmp_path = f"{path}.tmp"
+
+    with open(tmp_path, "w") as f:
+        json.dump(checkpoint.to_dict(), f)
+
+    os.replace(tmp_path, path)
+
+
+def load_checkpoint(path: str) -> SearchCheckpoint:
+    with open(path) as f:
+        return SearchCheckpoint.from_dict(json.load(f))
@@ -0,0 +1,206 @@
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+from chatcortex.optimization.architecture_candidate import ArchitectureCandidate
+from chatcortex.optimization.pareto import pareto_filter
+from chatcortex.synthesis.base import Synthesizer
+from chatcortex.synthesis.budget import BudgetExceeded, SynthesisBudget, SynthesisContext
+from chatcortex.synthesis.prefix_cache import PrefixFrontCache
+from chatcortex.synthesis.search_space import BOUND_SLACK, ChainSearchSpace
+from chatcortex.synthesis.task_specification import TaskSpecification
+
+
+class FrontState(NamedTuple):
+    """
+    Non-dominated prefix objective vector with a back-pointer
+
+    parent: index of the prefix state in the previous layer (-1 for root)
+    component: component index chosen at this stage (-1 for root)
+    """
+    cost: float
+    latency: float
+    reliability: float
+    parent: int
+    component: int
+
+
+ROOT_LAYER: Tuple[FrontState, ...] = (FrontState(0.0, 0.0, 1.0, -1, -1),)
+
+
+def _state_objectives(state: FrontState) -> Tuple[float, float, float]:
+    return (state.cost, state.latency, state.reliability)
+
+
+def extend_front(
+    layer: Sequence[FrontState],
+    space: ChainSearchSpace,
+    stage: int,
+    task: Optional[TaskSpecification] = None,
+) -> List[FrontState]:
+    """
+    Extend every prefix of a front layer by every component of a stage
+    and keep the non-dominated results (ties included)
+
+    If task is given, prefixes whose cheapest completion violates
+    max_cost / max_latency are dropped before filtering.
+    """
+
+    costs = space.costs[stage]
+    latencies = space.latencies[stage]
+    reliabilities = space.reliabilities[stage]
+
+    max_cost = max_latency = None
+    if task is not None and task.max_cost is not None:
+        max_cost = task.max_cost * (1.0 + BOUND_SLACK) - space.min_remaining_cost[stage + 1]
+    if task is not None and task.max_latency is not None:
+        max_latency = task.max_latency * (1.0 + BOUND_SLACK) - space.min_remaining_latency[stage + 1]
+
+    children = []
+
+    for parent, state in enumerate(layer):
+        for idx in range(space.radices[stage]):
+            cost = state.cost + costs[idx]
+            latency = state.latency + latencies[idx]
+
+            if max_cost is not None and cost > max_cost:
+                continue
+            if max_latency is not None and latency > max_latency:
+                continue
+
+            children.append(
+                FrontState(cost, latency, state.reliability * reliabilities[idx], parent, idx)
+            )
+
+    return pareto_filter(children, deduplicate=False, key=_state_objectives)
+
+
+def trace_back(layers: Sequence[Sequence[FrontState]], state_idx: int) -> Tuple[int, ...]:
+    """
+    Rebuild the component indices of a state in the last layer
+    """
+
+    indices = []
+
+    for layer in reversed(layers[1:]):
+        state = layer[state_idx]
+        indices.append(state.component)
+        state_idx = state.parent
+
+    return tuple(reversed(indices))
+
+
+class DynamicProgrammingSynthesizer(Synthesizer):
+    """
+    Exact multi-objective dynamic programming for chain tasks
+
+    Cost and latency are additive and reliability is multiplicative, so
+    extending a dominated prefix by the same component stays dominated.
+    The Pareto front of length-(k+1) prefixes is therefore contained in
+    the front of length-k prefixes extended by stage k+1, and only
+    non-dominated prefix vectors are carried from stage to stage.
+
+    Runtime is polynomial in the front sizes instead of exponential in
+    the number of stages. The returned frontier has the same distinct
+    objective vectors as ExhaustiveSynthesizer, but not always the same
+    architectures: prefixes whose sums are equal in exact arithmetic can
+    round differently, so one of two tied architectures may be dominated
+    by float rounding and dropped. Components with reliability 0 can
+    collapse dominance into ties as well.
+
+    Budget:
+        One evaluation per final architecture, as in the beam synthesizers
+
+    With an evaluator the front is still built on the static metrics and
+    only its final architectures are re-scored.
+
+    prefix_cache:
+        Optional PrefixFrontCache shared across tasks. Each task resumes
+        from the longest cached capability prefix and caches the fronts
+        it computes. Cached fronts are built without constraint pruning
+        (constraints are applied to the final front instead), so they can
+        be reused by tasks with different max_cost / max_latency.
+    """
+
+    def __init__(
+        self,
+        registry,
+        prefix_cache: Optional[PrefixFrontCache] = None,
+        archive_factory=None,
+        evaluator=None,
+    ):
+        super().__init__(registry, archive_factory=archive_factory, evaluator=evaluator)
+        self.prefix_cache = prefix_cache
+
+    def synthesize(
+        self,
+        task: TaskSpecification,
+        budget: Optional[SynthesisBudget] = None,
+    ) -> List[ArchitectureCandidate]:
+
+        task.validate()
+
+        context = SynthesisContext(budget)
+        pareto_set = self._new_archive()
+
+        space = ChainSearchSpace.from_task(self.registry, task)
+
+        if space.is_empty:
+            return []
+
+        layers: List[Sequence[FrontState]] = [ROOT_LAYER]
+        capabilities = task.required_capabilities
+        cache = self.prefix_cache
+
+        if cache is not None:
+            _, cached_layers = cache.longest_prefix(
+                self.registry, capabilities, task.privacy_constraint
+            )
+            if cached_layers is not None:
+                layers = list(cached_layers)
+
+        for stage in range(len(layers) - 1, space.num_stages):
+            if not context.can_evaluate():
+                return []
+
+            if cache is None:
+                layers.append(extend_front(layers[-1], space, stage, task))
+                continue
+
+            # Tuples are shared (not copied) between cache entries
+            layers.append(tuple(extend_front(layers[-1], space, stage)))
+            cache.put(
+                self.registry,
+                capabilities[: stage + 1],
+                task.privacy_constraint,
+                layers,
+            )
+
+        if self.evaluator is not None:
+            indices_list = [trace_back(layers, idx) for idx in range(len(layers[-1]))]
+            evaluated = self.evaluator.evaluate_batch(
+                [space.components(indices) for indices in indices_list], context
+            )
+
+            for indices, objectives in zip(indices_list, evaluated):
+                if objectives is not None and space.is_feasible(task, objectives[0], objectives[1]):
+                    pareto_set.add(space.to_candidate(indices, objectives))
+
+            return list(pareto_set)
+
+        for state_idx, state in enumerate(layers[-1]):
+
+            try:
+                context.register_evaluation()
+            except BudgetExceeded:
+                break
+
+            if not space.is_feasible(task, state.cost, state.latency):
+                continue
+
+            pareto_set.add(
+                space.to_candidate(
+                    trace_back(layers, state_idx),
+                    _state_objectives(state),
+                )
+            )
+
+        return list(pareto_set)
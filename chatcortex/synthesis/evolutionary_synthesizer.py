@@ -0,0 +1,606 @@
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from chatcortex.evaluation.evaluator import Evaluator
+from chatcortex.optimization.architecture_candidate import ArchitectureCandidate
+from chatcortex.optimization.pareto import pareto_filter
+from chatcortex.registry.capability_registry import CapabilityRegistry
+from chatcortex.registry.metadata import ComponentMetadata
+from chatcortex.synthesis.base import Synthesizer
+from chatcortex.synthesis.budget import SynthesisBudget, SynthesisContext
+from chatcortex.synthesis.search_space import ChainSearchSpace
+from chatcortex.synthesis.task_specification import TaskSpecification
+
+
+Genome = Tuple[int, ...]
+Objectives = Tuple[float, float, float]
+
+def _violation(
+    objectives: Objectives,
+    max_cost: Optional[float],
+    max_latency: Optional[float],
+) -> float:
+    """
+    Normalized total constraint violation (0.0 for feasible architectures)
+    """
+
+    violation = 0.0
+
+    if max_cost is not None and objectives[0] > max_cost:
+        violation += (objectives[0] - max_cost) / max(max_cost, 1e-12)
+
+    if max_latency is not None and objectives[1] > max_latency:
+        violation += (objectives[1] - max_latency) / max(max_latency, 1e-12)
+
+    return violation
+
+
+def _constrained_dominates(
+    a: Objectives, violation_a: float, b: Objectives, violation_b: float
+) -> bool:
+    """
+    Deb's constrained dominance: feasible beats infeasible, smaller
+    violation beats larger, otherwise regular Pareto dominance
+    """
+
+    if violation_a == 0.0 and violation_b > 0.0:
+        return True
+    if violation_a > 0.0:
+        return violation_b > violation_a
+
+    return (
+        a[0] <= b[0] and a[1] <= b[1] and a[2] >= b[2]
+        and (a[0] < b[0] or a[1] < b[1] or a[2] > b[2])
+    )
+
+
+def fast_non_dominated_sort(
+    objectives: Sequence[Objectives],
+    violations: Sequence[float],
+) -> List[List[int]]:
+    """
+    NSGA-II fast non-dominated sorting, O(M N^2)
+
+    Returns fronts of indices, best front first
+    """
+
+    n = len(objectives)
+    dominated_by: List[List[int]] = [[] for _ in range(n)]
+    domination_count = [0] * n
+    fronts: List[List[int]] = [[]]
+
+    for p in range(n):
+        for q in range(p + 1, n):
+            if _constrained_dominates(objectives[p], violations[p], objectives[q], violations[q]):
+                dominated_by[p].append(q)
+                domination_count[q] += 1
+            elif _constrained_dominates(objectives[q], violations[q], objectives[p], violations[p]):
+                dominated_by[q].append(p)
+                domination_count[p] += 1
+
+    for p in range(n):
+        if domination_count[p] == 0:
+            fronts[0].append(p)
+
+    while fronts[-1]:
+        next_front = []
+        for p in fronts[-1]:
+            for q in dominated_by[p]:
+                domination_count[q] -= 1
+                if domination_count[q] == 0:
+                    next_front.append(q)
+        fronts.append(next_front)
+
+    return fronts[:-1]
+
+
+def crowding_distance(
+    objectives: Sequence[Objectives],
+    front: Sequence[int],
+) -> Dict[int, float]:
+    """
+    NSGA-II crowding distance of the members of one front
+    """
+
+    distances = {i: 0.0 for i in front}
+
+    if len(front) <= 2:
+        return {i: float("inf") for i in front}
+
+    for objective in range(3):
+        ordered = sorted(front, key=lambda i: objectives[i][objective])
+
+        distances[ordered[0]] = float("inf")
+        distances[ordered[-1]] = float("inf")
+
+        low = objectives[ordered[0]][objective]
+        high = objectives[ordered[-1]][objective]
+        denom = high - low if high != low else 1.0
+
+        for k in range(1, len(ordered) - 1):
+            distances[ordered[k]] += (
+                objectives[ordered[k + 1]][objective] - objectives[ordered[k - 1]][objective]
+            ) / denom
+
+    return distances
+
+
+@dataclass
+class IslandState:
+    """
+    Complete, picklable state of one evolving population
+    """
+    population: List[Genome]
+    rng_state: tuple
+    evaluation_limit: Optional[int]
+    evaluations: int = 0
+    cache: Dict[Genome, Optional[Objectives]] = field(default_factory=dict)
+    archive: List[Tuple[Genome, Objectives]] = field(default_factory=list)
+    exhausted: bool = False
+
+
+@dataclass(frozen=True)
+class _EvolutionSettings:
+    stage_candidates: List[List[ComponentMetadata]]
+    max_cost: Optional[float]
+    max_latency: Optional[float]
+    population_size: int
+    crossover_rate: float
+    mutation_rate: float
+    evaluator: Optional[Evaluator] = None
+
+
+class _Island:
+    """
+    NSGA-II operators over one IslandState
+    """
+
+    def __init__(self, settings: _EvolutionSettings, state: IslandState):
+        self.settings = settings
+        self.state = state
+        self.space = ChainSearchSpace(settings.stage_candidates)
+        self.rng = random.Random()
+        self.rng.setstate(state.rng_state)
+
+    def random_genome(self) -> Genome:
+        return tuple(self.rng.randrange(radix) for radix in self.space.radices)
+
+    def violation(self, genome: Genome) -> float:
+        return _violation(
+            self.state.cache[genome], self.settings.max_cost, self.settings.max_latency
+        )
+
+    def evaluate(self, genomes: Sequence[Genome]) -> List[Genome]:
+        """
+        Evaluate genomes not seen before, within the island's evaluation
+        limit, as one batch. Returns the genomes that have objectives
+        afterwards.
+        """
+
+        state = self.state
+        evaluated = []
+        new_genomes = []
+        pending = set()
+
+        for genome in genomes:
+            if genome not in state.cache and genome not in pending:
+                if (
+                    state.evaluation_limit is not None
+                    and state.evaluations >= state.evaluation_limit
+                ):
+                    state.exhausted = True
+                    continue
+
+                state.evaluations += 1
+                pending.add(genome)
+                new_genomes.append(genome)
+
+            evaluated.append(genome)
+
+        if self.settings.evaluator is not None:
+            new_objectives = self.settings.evaluator.evaluate_batch(
+                [self.space.components(genome) for genome in new_genomes]
+            )
+        else:
+            new_objectives = [self.space.objectives(genome) for genome in new_genomes]
+
+        new_feasible = []
+
+        for genome, objectives in zip(new_genomes, new_objectives):
+
+            state.cache[genome] = objectives
+
+            # Discarded by the evaluator: rank last, never archive
+            if objectives is None:
+                continue
+
+            if _violation(objectives, self.settings.max_cost, self.settings.max_latency) == 0.0:
+                new_feasible.append((genome, objectives))
+
+        if new_feasible:
+            state.archive = pareto_filter(
+                state.archive + new_feasible,
+                deduplicate=False,
+                key=lambda item: item[1],
+            )
+
+        return evaluated
+
+    def sort(self, genomes: Sequence[Genome]) -> Tuple[List[Optional[Objectives]], List[List[int]]]:
+        """
+        Objectives of genomes and their constrained non-dominated fronts
+        (indices). Genomes discarded by the evaluator form a separate last
+        front.
+        """
+
+        objectives = [self.state.cache[g] for g in genomes]
+        kept = [i for i, values in enumerate(objectives) if values is not None]
+        discarded = [i for i, values in enumerate(objectives) if values is None]
+
+        fronts = [
+            [kept[i] for i in front]
+            for front in fast_non_dominated_sort(
+                [objectives[i] for i in kept],
+                [self.violation(genomes[i]) for i in kept],
+            )
+        ]
+
+        if discarded:
+            fronts.append(discarded)
+
+        return objectives, fronts
+
+    @staticmethod
+    def distances(objectives: Sequence[Optional[Objectives]], front: List[int]) -> Dict[int, float]:
+        """
+        Crowding distances of one front (zero for discarded genomes)
+        """
+
+        if objectives[front[0]] is None:
+            return {i: 0.0 for i in front}
+
+        return crowding_distance(objectives, front)
+
+    def rank(self, genomes: Sequence[Genome]) -> Tuple[Dict[Genome, int], Dict[Genome, float]]:
+        objectives, fronts = self.sort(genomes)
+
+        ranks: Dict[Genome, int] = {}
+        crowding: Dict[Genome, float] = {}
+
+        for level, front in enumerate(fronts):
+            distances = self.distances(objectives, front)
+            for i in front:
+                ranks[genomes[i]] = level
+                crowding[genomes[i]] = distances[i]
+
+        return ranks, crowding
+
+    def select(self, genomes: Sequence[Genome], size: int) -> List[Genome]:
+        """
+        Elitist truncation: whole fronts first, last front by crowding
+        """
+
+        objectives, fronts = self.sort(genomes)
+        selected: List[Genome] = []
+
+        for front in fronts:
+            if len(selected) + len(front) <= size:
+                selected.extend(genomes[i] for i in front)
+                continue
+
+            distances = self.distances(objectives, front)
+            ordered = sorted(front, key=lambda i: -distances[i])
+            selected.extend(genomes[i] for i in ordered[: size - len(selected)])
+            break
+
+        return selected
+
+    def tournament(self, ranks, crowding) -> Genome:
+        a = self.rng.choice(self.state.population)
+        b = self.rng.choice(self.state.population)
+        if (ranks[a], -crowding[a]) <= (ranks[b], -crowding[b]):
+            return a
+        return b
+
+    def offspring(self) -> List[Genome]:
+        ranks, crowding = self.rank(self.state.population)
+        children = []
+
+        while len(children) < self.settings.population_size:
+            parent_a = self.tournament(ranks, crowding)
+            parent_b = self.tournament(ranks, crowding)
+
+            # Uniform crossover
+            if self.rng.random() < self.settings.crossover_rate:
+                child = tuple(
+                    a if self.rng.random() < 0.5 else b
+                    for a, b in zip(parent_a, parent_b)
+                )
+            else:
+                child = parent_a
+
+            # Per-stage component mutation
+            child = tuple(
+                self.rng.randrange(radix)
+                if self.rng.random() < self.settings.mutation_rate
+                else gene
+                for gene, radix in zip(child, self.space.radices)
+            )
+
+            children.append(child)
+
+        return children
+
+    def initialize(self):
+        population = list(dict.fromkeys(self.state.population))
+
+        attempts = 0
+        while (
+            len(population) < self.settings.population_size
+            and attempts < 10 * self.settings.population_size
+        ):
+            genome = self.random_genome()
+            if genome not in population:
+                population.append(genome)
+            attempts += 1
+
+        self.state.population = self.evaluate(population)
+
+    def generation(self):
+        children = self.evaluate(self.offspring())
+        pool = list(dict.fromkeys(self.state.population + children))
+        self.state.population = self.select(pool, self.settings.population_size)
+
+    def export(self) -> IslandState:
+        self.state.rng_state = self.rng.getstate()
+        return self.state
+
+
+def _run_epoch(
+    settings: _EvolutionSettings,
+    state: IslandState,
+    generations: int,
+    deadline: Optional[float],
+) -> IslandState:
+    """
+    Worker: evolve one island for a number of generations
+    """
+
+    island = _Island(settings, state)
+
+    if not state.cache:
+        island.initialize()
+
+    for _ in range(generations):
+        if island.state.exhausted or not island.state.population:
+            break
+        if deadline is not None and time.time() >= deadline:
+            island.state.exhausted = True
+            break
+        island.generation()
+
+    return island.export()
+
+
+class EvolutionarySynthesizer(Synthesizer):
+    """
+    NSGA-II style evolutionary synthesizer for chain tasks
+
+    Genome: one component index per stage
+
+    Operators:
+        - binary tournament on (non-domination rank, crowding distance)
+        - uniform crossover
+        - per-stage component mutation
+        - elitist (mu + lambda) survival with crowding-based truncation
+        - constrained dominance for max_cost / max_latency
+
+    Budget:
+        One evaluation per distinct architecture (re-visited genomes are
+        cached and free). Seeded through SynthesisBudget.random_seed.
+
+    Island model (num_islands > 1):
+        Populations evolve independently for migration_interval
+        generations, then the best migration_size members of each island
+        replace the worst of the next one (ring topology). The evaluation
+        budget is split evenly across islands and each island has its own
+        seed, so results are identical whether islands run serially or in
+        num_workers processes.
+
+    seeder:
+        Optional callable (space, task) -> genomes placed in the initial
+        population (dealt round-robin over islands, at most
+        population_size per island), e.g.
+        WeightSweepSynthesizer(registry).seed_genomes
+    """
+
+    def __init__(
+        self,
+        registry: CapabilityRegistry,
+        population_size: int = 40,
+        max_generations: int = 100,
+        crossover_rate: float = 0.9,
+        mutation_rate: Optional[float] = None,
+        num_islands: int = 1,
+        migration_interval: int = 5,
+        migration_size: int = 2,
+        num_workers: Optional[int] = None,
+        seeder: Optional[Callable[[ChainSearchSpace, TaskSpecification], List[Genome]]] = None,
+        archive_factory=None,
+        evaluator=None,
+    ):
+        super().__init__(registry, archive_factory=archive_factory, evaluator=evaluator)
+
+        if population_size < 2:
+            raise ValueError("population_size must be at least 2")
+
+        if num_islands < 1:
+            raise ValueError("num_islands must be at least 1")
+
+        self.population_size = population_size
+        self.max_generations = max_generations
+        self.crossover_rate = crossover_rate
+        self.mutation_rate = mutation_rate
+        self.num_islands = num_islands
+        self.migration_interval = migration_interval
+        self.migration_size = migration_size
+        self.num_workers = num_workers
+        self.seeder = seeder
+
+    def _initial_states(
+        self,
+        budget: Optional[SynthesisBudget],
+        seeds: Sequence[Genome] = (),
+    ) -> List[IslandState]:
+
+        master = random.Random(budget.random_seed if budget else None)
+
+        limits: List[Optional[int]] = [None] * self.num_islands
+        if budget is not None and budget.max_evaluations is not None:
+            share, remainder = divmod(budget.max_evaluations, self.num_islands)
+            limits = [share + (1 if i < remainder else 0) for i in range(self.num_islands)]
+
+        states = []
+        for i, limit in enumerate(limits):
+            island_rng = random.Random(master.getrandbits(64))
+            states.append(
+                IslandState(
+                    population=list(seeds[i :: self.num_islands])[: self.population_size],
+                    rng_state=island_rng.getstate(),
+                    evaluation_limit=limit,
+                )
+            )
+
+        return states
+
+    def _migrate(self, settings: _EvolutionSettings, states: List[IslandState]) -> None:
+        """
+        Ring migration: best members of island i replace the worst of island i+1
+        """
+
+        if len(states) < 2 or self.migration_size < 1:
+            return
+
+        emigrants = []
+        for state in states:
+            island = _Island(settings, state)
+            ranked = island.select(state.population, len(state.population))
+            emigrants.append(ranked[: self.migration_size])
+            island.export()
+
+        for i, state in enumerate(states):
+            source = states[i - 1]
+            incoming = [
+                genome for genome in emigrants[i - 1] if genome not in state.population
+            ]
+            if not incoming:
+                continue
+
+            # Migrants were already evaluated (and archived) on their source island
+            for genome in incoming:
+                state.cache.setdefault(genome, source.cache[genome])
+
+            island = _Island(settings, state)
+            ranked = island.select(state.population, len(state.population))
+            keep = ranked[: max(0, len(ranked) - len(incoming))]
+            state.population = keep + incoming
+            island.export()
+
+    def synthesize(
+        self,
+        task: TaskSpecification,
+        budget: Optional[SynthesisBudget] = None,
+    ) -> List[ArchitectureCandidate]:
+
+        task.validate()
+
+        context = SynthesisContext(budget)
+        pareto_set = self._new_archive()
+
+        space = ChainSearchSpace.from_task(self.registry, task)
+
+        if space.is_empty:
+            return []
+
+        settings = _EvolutionSettings(
+            stage_candidates=space.stage_candidates,
+            max_cost=task.max_cost,
+            max_latency=task.max_latency,
+            population_size=self.population_size,
+            crossover_rate=self.crossover_rate,
+            mutation_rate=(
+                self.mutation_rate
+                if self.mutation_rate is not None
+                else 1.0 / space.num_stages
+            ),
+            evaluator=self.evaluator,
+        )
+
+        deadline = None
+        if budget is not None and budget.max_time_seconds is not None:
+            deadline = context.start_time + budget.max_time_seconds
+
+        seeds = [] if self.seeder is None else [
+            tuple(genome) for genome in self.seeder(space, task)
+        ]
+        states = self._initial_states(budget, seeds)
+
+        epoch = self.migration_interval if self.num_islands > 1 else self.max_generations
+        epoch = max(1, epoch)
+
+        pool = None
+        if self.num_islands > 1 and self.num_workers is not None and self.num_workers > 1:
+            pool = ProcessPoolExecutor(max_workers=self.num_workers)
+
+        try:
+            generations_done = 0
+            first_epoch = True
+
+            while first_epoch or (
+                generations_done < self.max_generations
+                and not all(state.exhausted for state in states)
+            ):
+                generations = min(epoch, self.max_generations - generations_done)
+
+                if pool is not None:
+                    states = list(pool.map(
+                        _run_epoch,
+                        [settings] * len(states),
+                        states,
+                        [generations] * len(states),
+                        [deadline] * len(states),
+                    ))
+                else:
+                    states = [
+                        _run_epoch(settings, state, generations, deadline)
+                        for state in states
+                    ]
+
+                generations_done += generations
+                first_epoch = False
+
+                if generations_done < self.max_generations:
+                    self._migrate(settings, states)
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
+        context.evaluations = sum(state.evaluations for state in states)
+
+        merged = pareto_filter(
+            [item for state in states for item in state.archive],
+            deduplicate=False,
+            key=lambda item: item[1],
+        )
+
+        seen = set()
+        for genome, objectives in merged:
+            if genome in seen:
+                continue
+            seen.add(genome)
+            pareto_set.add(space.to_candidate(genome, objectives))
+
+        return list(pareto_set)
@@ -1,15 +1,90 @@
-from itertools import product
-from typing import List, Optional
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice, product
+from typing import Iterator, List, Literal, Optional, Sequence, Tuple
 
-from chatcortex.optimization.architecture_candidate import ArchitectureCandidate
+import numpy as np
+
+from chatcortex.optimization.architecture_candidate import ArchitectureCandidate, CompactCandidate
 from chatcortex.graph.agent_graph import AgentGraph
-from chatcortex.optimization.pareto import ParetoSet
+from chatcortex.optimization.pareto import ParetoSet, dominates, pareto_filter
+from chatcortex.optimization.vectorized import non_dominated_mask
 from chatcortex.registry.capability_registry import CapabilityRegistry
+from chatcortex.registry.metadata import ComponentMetadata
 from chatcortex.synthesis.base import Synthesizer
 from chatcortex.synthesis.budget import BudgetExceeded, SynthesisBudget, SynthesisContext
+from chatcortex.synthesis.checkpoint import (
+    SearchCheckpoint,
+    compact_archive,
+    load_checkpoint,
+    save_checkpoint,
+    stage_names,
+)
+from chatcortex.synthesis.search_space import BOUND_SLACK, ChainSearchSpace
 from chatcortex.synthesis.task_specification import TaskSpecification
 
 
+ExhaustiveMode = Literal["product", "branch_and_bound", "vectorized"]
+
+# Feasible architectures buffered by a worker before each Pareto filtering pass
+_WORKER_BUFFER_SIZE = 4096
+
+IndexedObjectives = Tuple[Tuple[int, ...], Tuple[float, float, float]]
+
+
+def _indexed_objectives(item: IndexedObjectives) -> Tuple[float, float, float]:
+    return item[1]
+
+
+def _enumerate_index_range(
+    stage_candidates: Sequence[Sequence[ComponentMetadata]],
+    start: int,
+    stop: int,
+    max_cost: Optional[float],
+    max_latency: Optional[float],
+    deadline: Optional[float],
+) -> Tuple[List[IndexedObjectives], int]:
+    """
+    Worker: enumerate architectures start..stop-1 of the product space
+    with a local Pareto archive
+
+    Returns:
+        - non-dominated (indices, objectives) pairs (ties included)
+        - number of architectures evaluated
+    """
+
+    space = ChainSearchSpace(stage_candidates)
+
+    front: List[IndexedObjectives] = []
+    buffer: List[IndexedObjectives] = []
+    evaluated = 0
+
+    for indices in space.iter_indices(start, stop):
+
+        if deadline is not None and evaluated % 1024 == 0 and time.time() >= deadline:
+            break
+
+        evaluated += 1
+
+        objectives = space.objectives(indices)
+
+        if max_cost is not None and objectives[0] > max_cost:
+            continue
+
+        if max_latency is not None and objectives[1] > max_latency:
+            continue
+
+        buffer.append((indices, objectives))
+
+        if len(buffer) >= _WORKER_BUFFER_SIZE:
+            front = pareto_filter(front + buffer, deduplicate=False, key=_indexed_objectives)
+            buffer = []
+
+    front = pareto_filter(front + buffer, deduplicate=False, key=_indexed_objectives)
+
+    return front, evaluated
+
+
 class ExhaustiveSynthesizer(Synthesizer):
     """
     Generate all feasible architectures via Cartesian product
@@ -19,7 +94,81 @@ class ExhaustiveSynthesizer(Synthesizer):
         - Budget-aware
         - Incremental Pareto maintenance
         - Memory-efficient (no full cartesian materialization)
+
+    Modes:
+        - product: lazy Cartesian product, every combination is evaluated
+        - branch_and_bound: depth-first search that prunes a prefix when
+          its cost/latency plus the cheapest completion violates a
+          constraint, or when an optimistic bound on its completions is
+          already dominated by the archive. Still exact, and only complete
+          architectures count against the evaluation budget
+        - vectorized: enumerates index chunks of chunk_size architectures,
+          computing metrics by broadcasting over per-stage metric arrays,
+          applying constraints as boolean masks and Pareto-filtering each
+          chunk in NumPy. Graphs are built only for the final survivors and
+          memory is bounded by chunk_size plus the front. Same budget
+          semantics as product mode
+
+    num_workers (product mode):
+        If > 1, the mixed-radix index range of the product is split into
+        balanced contiguous chunks enumerated in worker processes, each
+        with its own local Pareto archive, and the local fronts are merged
+        at the end. With max_evaluations the enumerated range is the first
+        max_evaluations architectures, exactly as in the serial run, so
+        budgeted runs stay reproducible.
+
+    checkpoint_path (serial product mode):
+        Every checkpoint_interval evaluations, and when the run ends, the
+        enumeration cursor, evaluation count and archive are written to
+        this file. resume(path, budget) continues from it; max_evaluations
+        counts evaluations over all runs, so a budgeted run can be
+        extended by resuming with a larger budget.
+
+    evaluator (serial product mode):
+        Architectures are submitted in batches of evaluator.batch_size
     """
+
+    def __init__(
+        self,
+        registry: CapabilityRegistry,
+        mode: ExhaustiveMode = "product",
+        num_workers: Optional[int] = None,
+        chunks_per_worker: int = 4,
+        chunk_size: int = 65536,
+        checkpoint_path: Optional[str] = None,
+        checkpoint_interval: int = 10000,
+        archive_factory=None,
+        evaluator=None,
+    ):
+        super().__init__(registry, archive_factory=archive_factory, evaluator=evaluator)
+
+        if mode not in ("product", "branch_and_bound", "vectorized"):
+            raise ValueError(f"Invalid exhaustive mode: {mode}")
+
+        if num_workers is not None and num_workers > 1 and mode != "product":
+            raise ValueError("num_workers is only supported in product mode")
+
+        if checkpoint_path is not None and (
+            mode != "product" or (num_workers is not None and num_workers > 1)
+        ):
+            raise ValueError("Checkpointing is only supported in serial product mode")
+
+        if checkpoint_interval < 1:
+            raise ValueError("checkpoint_interval must be positive")
+
+        if evaluator is not None and (
+            mode != "product"
+            or (num_workers is not None and num_workers > 1)
+            or checkpoint_path is not None
+        ):
+            raise ValueError("evaluator is only supported in serial product mode")
+
+        self.mode = mode
+        self.num_workers = num_workers
+        self.chunks_per_worker = chunks_per_worker
+        self.chunk_size = chunk_size
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint_interval = checkpoint_interval
     
     def synthesize(
         self, 
@@ -29,8 +178,55 @@ class ExhaustiveSynthesizer(Synthesizer):
 
         task.validate()
 
+        if self.mode == "branch_and_bound":
+            return self._synthesize_branch_and_bound(task, budget)
+
+        if self.mode == "vectorized":
+            return self._synthesize_vectorized(task, budget)
+
+        if self.num_workers is not None and self.num_workers > 1:
+            return self._synthesize_parallel(task, budget)
+
+        if self.checkpoint_path is not None:
+            return self._synthesize_checkpointed(task, budget, self.checkpoint_path)
+
         context = SynthesisContext(budget)
-        pareto_set = ParetoSet()
+        pareto_set = self._new_archive()
+
+        for _ in self._product_steps(task, context, pareto_set):
+            pass
+
+        return list(pareto_set)
+
+    def _search(
+        self,
+        task: TaskSpecification,
+        budget: Optional[SynthesisBudget],
+        context: SynthesisContext,
+        archive: ParetoSet,
+    ) -> Optional[Iterator[bool]]:
+        if (
+            self.mode != "product"
+            or (self.num_workers is not None and self.num_workers > 1)
+            or self.checkpoint_path is not None
+        ):
+            return None
+        return self._product_steps(task, context, archive)
+
+    def _product_steps(
+        self,
+        task: TaskSpecification,
+        context: SynthesisContext,
+        pareto_set: ParetoSet,
+    ) -> Iterator[bool]:
+        """
+        Serial product enumeration, yields after every evaluation whether
+        the archive changed
+        """
+
+        if self.evaluator is not None:
+            yield from self._evaluated_product_steps(task, context, pareto_set)
+            return
 
         # Step 1: Collect candidates per capability
         candidate_lists = []
@@ -42,7 +238,7 @@ class ExhaustiveSynthesizer(Synthesizer):
             )
 
             if not candidates:
-                return [] 
+                return
 
             candidate_lists.append(candidates)
         
@@ -72,9 +268,11 @@ class ExhaustiveSynthesizer(Synthesizer):
             total_reliability = graph.aggregate_reliability()
 
             if task.max_cost is not None and total_cost > task.max_cost:
+                yield False
                 continue
 
             if task.max_latency is not None and total_latency > task.max_latency:
+                yield False
                 continue
 
             
@@ -86,6 +284,319 @@ class ExhaustiveSynthesizer(Synthesizer):
             )
             
             # Incremental Pareto insertion
-            pareto_set.add(candidate)
-        
-        return list(pareto_set)
\ No newline at end of file
+            yield pareto_set.add(candidate)
+
+    def _evaluated_product_steps(
+        self,
+        task: TaskSpecification,
+        context: SynthesisContext,
+        pareto_set: ParetoSet,
+    ) -> Iterator[bool]:
+        """
+        Product enumeration submitting evaluator.batch_size architectures
+        at a time
+        """
+
+        space = ChainSearchSpace.from_task(self.registry, task)
+
+        if space.is_empty:
+            return
+
+        indices_iter = space.iter_indices()
+
+        while True:
+            batch = list(islice(indices_iter, self.evaluator.batch_size))
+
+            if not batch:
+                return
+
+            evaluated = self.evaluator.evaluate_batch(
+                [space.components(indices) for indices in batch], context
+            )
+
+            for indices, objectives in zip(batch, evaluated):
+                if objectives is None or not space.is_feasible(task, objectives[0], objectives[1]):
+                    yield False
+                    continue
+
+                yield pareto_set.add(space.to_candidate(indices, objectives))
+
+            if len(evaluated) < len(batch):
+                return # Budget exhausted
+
+    def resume(
+        self,
+        path: str,
+        budget: Optional[SynthesisBudget] = None,
+    ) -> List[ArchitectureCandidate]:
+        """
+        Continue a checkpointed product-mode run
+
+        Later checkpoints go to checkpoint_path if set, else back to path.
+        """
+
+        checkpoint = load_checkpoint(path)
+
+        if checkpoint.synthesizer != type(self).__name__:
+            raise ValueError(f"Checkpoint was written by {checkpoint.synthesizer}")
+
+        return self._synthesize_checkpointed(
+            checkpoint.task, budget, self.checkpoint_path or path, checkpoint
+        )
+
+    def _synthesize_checkpointed(
+        self,
+        task: TaskSpecification,
+        budget: Optional[SynthesisBudget],
+        path: str,
+        checkpoint: Optional[SearchCheckpoint] = None,
+    ) -> List[ArchitectureCandidate]:
+        """
+        Product mode over mixed-radix indices with periodic checkpoints
+
+        Enumerates in the same order as itertools.product, so results
+        match the plain product mode.
+        """
+
+        context = SynthesisContext(budget)
+        pareto_set = self._new_archive()
+        cursor = 0
+
+        space = ChainSearchSpace.from_task(self.registry, task)
+
+        if checkpoint is not None:
+            checkpoint.check_space(space)
+            checkpoint.restore_archive(self.registry, pareto_set)
+            context.evaluations = checkpoint.evaluations
+            cursor = checkpoint.cursor or 0
+
+        if space.is_empty:
+            return []
+
+        def save():
+            save_checkpoint(path, SearchCheckpoint(
+                synthesizer=type(self).__name__,
+                task=task,
+                stages=stage_names(space),
+                evaluations=context.evaluations,
+                archive=compact_archive(pareto_set),
+                cursor=cursor,
+            ))
+
+        for indices in space.iter_indices(cursor):
+
+            try:
+                context.register_evaluation()
+            except BudgetExceeded:
+                break
+
+            cursor += 1
+
+            total_cost, total_latency, total_reliability = space.objectives(indices)
+
+            if space.is_feasible(task, total_cost, total_latency):
+                pareto_set.add(
+                    space.to_candidate(indices, (total_cost, total_latency, total_reliability))
+                )
+
+            if context.evaluations % self.checkpoint_interval == 0:
+                save()
+
+        save()
+
+        return list(pareto_set)
+
+    def _synthesize_branch_and_bound(
+        self,
+        task: TaskSpecification,
+        budget: Optional[SynthesisBudget],
+    ) -> List[ArchitectureCandidate]:
+
+        context = SynthesisContext(budget)
+        pareto_set = self._new_archive()
+
+        space = ChainSearchSpace.from_task(self.registry, task)
+
+        if space.is_empty:
+            return []
+
+        num_stages = space.num_stages
+        max_cost = (
+            task.max_cost * (1.0 + BOUND_SLACK) if task.max_cost is not None else None
+        )
+        max_latency = (
+            task.max_latency * (1.0 + BOUND_SLACK) if task.max_latency is not None else None
+        )
+
+        def bound_dominated(cost: float, latency: float, reliability: float) -> bool:
+            bound = CompactCandidate((), (
+                cost * (1.0 - BOUND_SLACK),
+                latency * (1.0 - BOUND_SLACK),
+                reliability * (1.0 + BOUND_SLACK),
+            ))
+            return any(dominates(member, bound) for member in pareto_set)
+
+        indices = [0] * num_stages
+
+        def search(stage: int, cost: float, latency: float, reliability: float):
+
+            if stage == num_stages:
+                context.register_evaluation()
+
+                if not space.is_feasible(task, cost, latency):
+                    return
+
+                pareto_set.add(
+                    space.to_candidate(indices, (cost, latency, reliability))
+                )
+                return
+
+            for idx in range(space.radices[stage]):
+                next_cost = cost + space.costs[stage][idx]
+                next_latency = latency + space.latencies[stage][idx]
+                next_reliability = reliability * space.reliabilities[stage][idx]
+
+                optimistic_cost = next_cost + space.min_remaining_cost[stage + 1]
+                optimistic_latency = next_latency + space.min_remaining_latency[stage + 1]
+
+                # Constraint pruning: even the cheapest completion is infeasible
+                if max_cost is not None and optimistic_cost > max_cost:
+                    continue
+
+                if max_latency is not None and optimistic_latency > max_latency:
+                    continue
+
+                # Dominance pruning: every completion is dominated by the archive
+                if stage + 1 < num_stages and bound_dominated(
+                    optimistic_cost,
+                    optimistic_latency,
+                    next_reliability * space.max_remaining_reliability[stage + 1],
+                ):
+                    continue
+
+                indices[stage] = idx
+                search(stage + 1, next_cost, next_latency, next_reliability)
+
+        try:
+            search(0, 0.0, 0.0, 1.0)
+        except BudgetExceeded:
+            pass
+
+        return list(pareto_set)
+
+    def _synthesize_parallel(
+        self,
+        task: TaskSpecification,
+        budget: Optional[SynthesisBudget],
+    ) -> List[ArchitectureCandidate]:
+
+        context = SynthesisContext(budget)
+        pareto_set = self._new_archive()
+
+        space = ChainSearchSpace.from_task(self.registry, task)
+
+        if space.is_empty:
+            return []
+
+        # Deterministic budget split: the serial run evaluates exactly the
+        # first max_evaluations architectures in product order
+        limit = space.size
+        if budget is not None and budget.max_evaluations is not None:
+            limit = min(limit, budget.max_evaluations)
+
+        deadline = None
+        if budget is not None and budget.max_time_seconds is not None:
+            deadline = context.start_time + budget.max_time_seconds
+
+        num_chunks = max(1, min(limit, self.num_workers * self.chunks_per_worker))
+        bounds = [limit * i // num_chunks for i in range(num_chunks + 1)]
+
+        with ProcessPoolExecutor(max_workers=self.num_workers) as pool:
+            futures = [
+                pool.submit(
+                    _enumerate_index_range,
+                    space.stage_candidates,
+                    bounds[i],
+                    bounds[i + 1],
+                    task.max_cost,
+                    task.max_latency,
+                    deadline,
+                )
+                for i in range(num_chunks)
+                if bounds[i] < bounds[i + 1]
+            ]
+            results = [future.result() for future in futures]
+
+        local_fronts = []
+        for front, evaluated in results:
+            context.evaluations += evaluated
+            local_fronts.extend(front)
+
+        for indices, objectives in pareto_filter(
+            local_fronts, deduplicate=False, key=_indexed_objectives
+        ):
+            pareto_set.add(space.to_candidate(indices, objectives))
+
+        return list(pareto_set)
+
+    def _synthesize_vectorized(
+        self,
+        task: TaskSpecification,
+        budget: Optional[SynthesisBudget],
+    ) -> List[ArchitectureCandidate]:
+
+        context = SynthesisContext(budget)
+        pareto_set = self._new_archive()
+
+        space = ChainSearchSpace.from_task(self.registry, task)
+
+        if space.is_empty:
+            return []
+
+        if space.size >= 2 ** 63:
+            raise ValueError("Search space too large for int64 mixed-radix indexing")
+
+        limit = space.size
+        if budget is not None and budget.max_evaluations is not None:
+            limit = min(limit, budget.max_evaluations)
+
+        front_indices = np.empty(0, dtype=np.int64)
+        front_objectives = np.empty((0, 3))
+
+        for start in range(0, limit, self.chunk_size):
+
+            if not context.can_evaluate():
+                break
+
+            stop = min(limit, start + self.chunk_size)
+            index_array = np.arange(start, stop, dtype=np.int64)
+            objectives = space.objectives_batch(space.digits_batch(index_array))
+
+            context.evaluations += stop - start
+
+            feasible = np.ones(len(index_array), dtype=bool)
+            if task.max_cost is not None:
+                feasible &= objectives[:, 0] <= task.max_cost
+            if task.max_latency is not None:
+                feasible &= objectives[:, 1] <= task.max_latency
+
+            index_array = index_array[feasible]
+            objectives = objectives[feasible]
+
+            survivors = non_dominated_mask(objectives)
+
+            front_indices = np.concatenate((front_indices, index_array[survivors]))
+            front_objectives = np.concatenate((front_objectives, objectives[survivors]))
+
+            keep = non_dominated_mask(front_objectives)
+            front_indices = front_indices[keep]
+            front_objectives = front_objectives[keep]
+
+        for index, (cost, latency, reliability) in zip(
+            front_indices.tolist(), front_objectives.tolist()
+        ):
+            pareto_set.add(
+                space.to_candidate(space.decode(index), (cost, latency, reliability))
+            )
+
+        return list(pareto_set)
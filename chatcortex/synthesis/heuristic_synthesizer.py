@@ -47,6 +47,7 @@ class HeuristicSynthesizer(Synthesizer):
 
         graph = AgentGraph()
         previous_node: Optional[str] = None
+        selected_components = []
 
         for idx, capability in enumerate(task.required_capabilities):
 
@@ -66,6 +67,7 @@ class HeuristicSynthesizer(Synthesizer):
             )
 
             selected_candidate = candidates_sorted[0]
+            selected_components.append(selected_candidate)
             node_id = f"{selected_candidate.name}_{idx}"
             
             graph.add_component(node_id, selected_candidate)
@@ -75,27 +77,41 @@ class HeuristicSynthesizer(Synthesizer):
             
             previous_node = node_id
         
-        try:
-            context.register_evaluation()
-        except BudgetExceeded:
-            return []
-        
         # Compute metrics
 
-        total_cost = graph.total_cost()
-        total_latency = graph.total_latency()
-        total_reliability = graph.aggregate_reliability()
+        if self.evaluator is not None:
+            # The evaluator charges the evaluation
+            evaluated = self.evaluator.evaluate_batch([selected_components], context)
+
+            if not evaluated:
+                return []
+
+            objectives = evaluated[0]
+
+            if objectives is None:
+                raise SynthesisError("Constructed agent was discarded by the evaluator")
+
+            total_cost, total_latency, total_reliability = objectives
+        else:
+            try:
+                context.register_evaluation()
+            except BudgetExceeded:
+                return []
+
+            total_cost = graph.total_cost()
+            total_latency = graph.total_latency()
+            total_reliability = graph.aggregate_reliability()
 
         # Hard constraints
 
         if task.max_cost is not None:
-            if graph.total_cost() > task.max_cost:
+            if total_cost > task.max_cost:
                 raise SynthesisError(
                     f"Constructed agent exceeds max_cost constraint"
                 )
         
         if task.max_latency is not None:
-            if graph.total_latency() > task.max_latency:
+            if total_latency > task.max_latency:
                 raise SynthesisError(
                     f"Constructed agent exceeds max_latency constraint"
                 )
@@ -0,0 +1,282 @@
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from chatcortex.optimization.architecture_candidate import ArchitectureCandidate
+from chatcortex.optimization.pareto import pareto_filter
+from chatcortex.optimization.vectorized import non_dominated_mask
+from chatcortex.registry.capability_registry import RegistryDelta
+from chatcortex.synthesis.base import Synthesizer
+from chatcortex.synthesis.budget import SynthesisBudget
+from chatcortex.synthesis.dynamic_programming_synthesizer import (
+    ROOT_LAYER,
+    DynamicProgrammingSynthesizer,
+    FrontState,
+    _state_objectives,
+    extend_front,
+    trace_back,
+)
+from chatcortex.synthesis.search_space import ChainSearchSpace
+from chatcortex.synthesis.task_specification import TaskSpecification
+
+
+Layer = Tuple[FrontState, ...]
+
+
+def extend_suffix_front(
+    front: Sequence[FrontState],
+    space: ChainSearchSpace,
+    stage: int,
+) -> Layer:
+    """
+    Prepend every component of a stage to every suffix of a front and
+    keep the non-dominated results (ties included)
+
+    parent indexes the suffix state in the front for stage + 1
+    """
+
+    costs = space.costs[stage]
+    latencies = space.latencies[stage]
+    reliabilities = space.reliabilities[stage]
+
+    children = [
+        FrontState(
+            costs[idx] + state.cost,
+            latencies[idx] + state.latency,
+            reliabilities[idx] * state.reliability,
+            child,
+            idx,
+        )
+        for idx in range(space.radices[stage])
+        for child, state in enumerate(front)
+    ]
+
+    return tuple(pareto_filter(children, deduplicate=False, key=_state_objectives))
+
+
+@dataclass
+class IncrementalResult:
+    """
+    Frontier of a chain task plus the stage fronts needed to update it
+
+    forward[k]: front of the first k stages, valid for k < len(forward)
+    backward[k]: front of stages k..end, valid for k >= backward_start
+    (entries below backward_start are None)
+
+    Stage fronts are unconstrained, constraints only filter the frontier.
+    """
+
+    task: TaskSpecification
+    space: ChainSearchSpace
+    forward: List[Layer]
+    backward: List[Optional[Layer]]
+    backward_start: int
+    frontier: List[ArchitectureCandidate]
+
+
+@dataclass
+class FrontierUpdate:
+    """
+    Outcome of an incremental update
+
+    entered / left compare (architecture, objectives), so an architecture
+    whose metrics changed appears in both lists
+    """
+
+    result: IncrementalResult
+    entered: List[ArchitectureCandidate]
+    left: List[ArchitectureCandidate]
+
+    @property
+    def frontier(self) -> List[ArchitectureCandidate]:
+        return self.result.frontier
+
+
+class IncrementalChainSynthesizer(Synthesizer):
+    """
+    Exact chain synthesis that can be updated after registry changes
+
+    initialize() runs the DP of DynamicProgrammingSynthesizer in both
+    directions and keeps every prefix front F_k and suffix front G_k.
+    A Pareto-optimal architecture splits, at any stage s, into a prefix
+    in F_s and a suffix in G_s, so the frontier is the non-dominated part
+    of F_s x G_s.
+
+    update() applies a RegistryDelta. If the changed capabilities occupy
+    stages a..b, prefix fronts up to stage a and suffix fronts after
+    stage b are still valid; only stages a..b are re-extended, and the
+    frontier is recombined from F_(b+1) and G_(b+1).
+
+    Objectives of the frontier are recomputed in AgentGraph order, but
+    recombined sums may round differently, so exact floating-point ties
+    can be resolved differently from a full rerun.
+
+    Budget:
+        synthesize() counts one evaluation per final architecture, like
+        DynamicProgrammingSynthesizer
+    """
+
+    def synthesize(
+        self,
+        task: TaskSpecification,
+        budget: Optional[SynthesisBudget] = None,
+    ) -> List[ArchitectureCandidate]:
+
+        return DynamicProgrammingSynthesizer(
+            self.registry,
+            archive_factory=self.archive_factory,
+            evaluator=self.evaluator,
+        ).synthesize(task, budget)
+
+    def initialize(self, task: TaskSpecification) -> IncrementalResult:
+
+        task.validate()
+
+        space = ChainSearchSpace.from_task(self.registry, task)
+        num_stages = space.num_stages
+
+        forward: List[Layer] = [ROOT_LAYER]
+        backward: List[Optional[Layer]] = [None] * num_stages + [ROOT_LAYER]
+        backward_start = num_stages
+
+        if not space.is_empty:
+            for stage in range(num_stages):
+                forward.append(tuple(extend_front(forward[-1], space, stage)))
+
+            for stage in range(num_stages - 1, -1, -1):
+                backward[stage] = extend_suffix_front(backward[stage + 1], space, stage)
+
+            backward_start = 0
+
+        result = IncrementalResult(
+            task=task,
+            space=space,
+            forward=forward,
+            backward=backward,
+            backward_start=backward_start,
+            frontier=[],
+        )
+        result.frontier = self._recombine(result, num_stages)
+
+        return result
+
+    def update(self, previous: IncrementalResult, delta: RegistryDelta) -> FrontierUpdate:
+        """
+        Apply delta to the registry and update a previous result
+
+        The previous result is not modified.
+        """
+
+        affected = self.registry.apply(delta)
+
+        task = previous.task
+        space = ChainSearchSpace.from_task(self.registry, task)
+
+        stages = [
+            stage for stage, capability in enumerate(task.required_capabilities)
+            if capability in affected
+        ]
+
+        if not stages:
+            result = IncrementalResult(
+                task=task,
+                space=space,
+                forward=list(previous.forward),
+                backward=list(previous.backward),
+                backward_start=previous.backward_start,
+                frontier=list(previous.frontier),
+            )
+            return FrontierUpdate(result=result, entered=[], left=[])
+
+        first, last = stages[0], stages[-1]
+        split = last + 1
+
+        # F_k depends on stages < k, G_k on stages >= k
+        forward = list(previous.forward[: min(len(previous.forward), first + 1)])
+        backward = list(previous.backward)
+        backward_start = max(previous.backward_start, split)
+
+        for stage in range(backward_start):
+            backward[stage] = None
+
+        if space.is_empty:
+            forward = forward[:1]
+        else:
+            for stage in range(len(forward) - 1, split):
+                forward.append(tuple(extend_front(forward[-1], space, stage)))
+
+            for stage in range(backward_start - 1, split - 1, -1):
+                backward[stage] = extend_suffix_front(backward[stage + 1], space, stage)
+
+            backward_start = split
+
+        result = IncrementalResult(
+            task=task,
+            space=space,
+            forward=forward,
+            backward=backward,
+            backward_start=backward_start,
+            frontier=[],
+        )
+        result.frontier = self._recombine(result, split)
+
+        previous_keys = {self._key(c) for c in previous.frontier}
+        current_keys = {self._key(c) for c in result.frontier}
+
+        return FrontierUpdate(
+            result=result,
+            entered=[c for c in result.frontier if self._key(c) not in previous_keys],
+            left=[c for c in previous.frontier if self._key(c) not in current_keys],
+        )
+
+    @staticmethod
+    def _key(candidate: ArchitectureCandidate):
+        return (
+            candidate.architecture_key(),
+            candidate.total_cost,
+            candidate.total_latency,
+            candidate.total_reliability,
+        )
+
+    def _recombine(self, result: IncrementalResult, split: int) -> List[ArchitectureCandidate]:
+        """
+        Frontier from prefix front F_split and suffix front G_split
+        """
+
+        space, task = result.space, result.task
+
+        if space.is_empty:
+            return []
+
+        prefix = result.forward[split]
+        suffix = result.backward[split]
+
+        prefix_objectives = np.array([_state_objectives(s) for s in prefix], dtype=float)
+        suffix_objectives = np.array([_state_objectives(s) for s in suffix], dtype=float)
+
+        combined = np.column_stack((
+            (prefix_objectives[:, None, 0] + suffix_objectives[None, :, 0]).ravel(),
+            (prefix_objectives[:, None, 1] + suffix_objectives[None, :, 1]).ravel(),
+            (prefix_objectives[:, None, 2] * suffix_objectives[None, :, 2]).ravel(),
+        ))
+
+        archive = self._new_archive()
+
+        for pair in np.flatnonzero(non_dominated_mask(combined)).tolist():
+            prefix_idx, suffix_idx = divmod(pair, len(suffix))
+
+            indices = list(trace_back(result.forward[: split + 1], prefix_idx))
+            for stage in range(split, space.num_stages):
+                state = result.backward[stage][suffix_idx]
+                indices.append(state.component)
+                suffix_idx = state.parent
+
+            objectives = space.objectives(indices)
+
+            if not space.is_feasible(task, objectives[0], objectives[1]):
+                continue
+
+            archive.add(space.to_candidate(indices, objectives))
+
+        return list(archive)
@@ -0,0 +1,207 @@
+import heapq
+from itertools import islice
+from typing import Iterator, List, Optional, Tuple
+
+from chatcortex.optimization.architecture_candidate import ArchitectureCandidate
+from chatcortex.synthesis.base import Synthesizer
+from chatcortex.synthesis.budget import BudgetExceeded, SynthesisBudget, SynthesisContext
+from chatcortex.synthesis.search_space import BOUND_SLACK, ChainSearchSpace
+from chatcortex.synthesis.task_specification import TaskSpecification
+
+
+class KBestSynthesizer(Synthesizer):
+    """
+    Exact top-k architectures of a chain task by weighted score
+
+    Score (lower is better) is the HeuristicSynthesizer component score
+    summed over stages:
+
+        sum_s w_cost * cost_s + w_latency * latency_s - w_error * reliability_s
+
+    It is additive over stages, so architectures can be enumerated lazily
+    in exact increasing score order:
+
+    - candidates of every stage are sorted by score, and an architecture
+      is a tuple of ranks
+    - the parent of an architecture decrements its last non-zero rank, so
+      the children of a state increment one rank at or after its last
+      non-zero position. Every architecture has exactly one parent and
+      never scores better than it, so a heap popping states in score
+      order yields each architecture once, in order
+
+    The top k cost k pops and at most k * num_stages pushed states.
+
+    Constraints:
+        A state is dropped with its whole subtree when the cheapest
+        completion of its subtree exceeds max_cost or max_latency (its
+        descendants only change ranks from its last non-zero position
+        on). Infeasible states whose subtree may still be feasible are
+        expanded but not returned.
+
+    Budget:
+        One evaluation per popped architecture, or per returned
+        architecture submitted to the evaluator. With an evaluator, order
+        and pruning use the static metrics, and architectures it discards
+        or whose evaluated metrics violate the constraints are dropped.
+
+    Returns the top k in increasing score order (archive_factory is not
+    used, the result is not Pareto filtered).
+    """
+
+    def __init__(
+        self,
+        registry,
+        k: int = 10,
+        archive_factory=None,
+        evaluator=None,
+    ):
+        super().__init__(registry, archive_factory=archive_factory, evaluator=evaluator)
+
+        if k < 1:
+            raise ValueError("k must be positive")
+
+        self.k = k
+        self.expanded_states = 0
+
+    def synthesize(
+        self,
+        task: TaskSpecification,
+        budget: Optional[SynthesisBudget] = None,
+    ) -> List[ArchitectureCandidate]:
+
+        task.validate()
+
+        context = SynthesisContext(budget)
+        space = ChainSearchSpace.from_task(self.registry, task)
+
+        ranked = self._ranked(space, task, context if self.evaluator is None else None)
+        top = [indices for _, indices in islice(ranked, self.k)]
+
+        if self.evaluator is None:
+            return [space.to_candidate(indices) for indices in top]
+
+        evaluated = self.evaluator.evaluate_batch([space.components(i) for i in top], context)
+
+        return [
+            space.to_candidate(indices, objectives)
+            for indices, objectives in zip(top, evaluated)
+            if objectives is not None and space.is_feasible(task, objectives[0], objectives[1])
+        ]
+
+    def iter_ranked(
+        self,
+        task: TaskSpecification,
+        budget: Optional[SynthesisBudget] = None,
+    ) -> Iterator[Tuple[float, ArchitectureCandidate]]:
+        """
+        Lazily yield (score, candidate) for every feasible architecture in
+        increasing score order (static metrics)
+        """
+
+        task.validate()
+
+        context = SynthesisContext(budget)
+        space = ChainSearchSpace.from_task(self.registry, task)
+
+        for score, indices in self._ranked(space, task, context):
+            yield score, space.to_candidate(indices)
+
+    def _ranked(
+        self,
+        space: ChainSearchSpace,
+        task: TaskSpecification,
+        context: Optional[SynthesisContext],
+    ) -> Iterator[Tuple[float, Tuple[int, ...]]]:
+        """
+        (score, component indices) of feasible architectures in increasing
+        score order, charging one evaluation per popped state to context
+        """
+
+        self.expanded_states = 0
+
+        if space.is_empty:
+            return
+
+        weights = task.objective_weights
+        num_stages = space.num_stages
+
+        # Stage candidates sorted by score: order[s][rank] -> component index
+        order: List[List[int]] = []
+        scores: List[List[float]] = []
+
+        for stage in range(num_stages):
+            stage_scores = [
+                weights["cost"] * cost
+                + weights["latency"] * latency
+                - weights["error"] * reliability
+                for cost, latency, reliability in zip(
+                    space.costs[stage], space.latencies[stage], space.reliabilities[stage]
+                )
+            ]
+            ranking = sorted(range(len(stage_scores)), key=stage_scores.__getitem__)
+            order.append(ranking)
+            scores.append([stage_scores[idx] for idx in ranking])
+
+        # Subtree bounds: cheapest cost / latency among ranks >= r of a stage
+        min_cost_from = [self._suffix_min(space.costs[s], order[s]) for s in range(num_stages)]
+        min_latency_from = [self._suffix_min(space.latencies[s], order[s]) for s in range(num_stages)]
+
+        def subtree_feasible(ranks: Tuple[int, ...], pivot: int) -> bool:
+            # Stages before pivot are fixed, stages after it are free
+            cost = space.min_remaining_cost[pivot + 1] + min_cost_from[pivot][ranks[pivot]]
+            latency = space.min_remaining_latency[pivot + 1] + min_latency_from[pivot][ranks[pivot]]
+
+            for stage in range(pivot):
+                idx = order[stage][ranks[stage]]
+                cost += space.costs[stage][idx]
+                latency += space.latencies[stage][idx]
+
+            if task.max_cost is not None and cost > task.max_cost * (1 + BOUND_SLACK):
+                return False
+
+            if task.max_latency is not None and latency > task.max_latency * (1 + BOUND_SLACK):
+                return False
+
+            return True
+
+        def push(heap, ranks: Tuple[int, ...], pivot: int) -> None:
+            if not subtree_feasible(ranks, pivot):
+                return
+
+            score = sum(scores[stage][rank] for stage, rank in enumerate(ranks))
+            heapq.heappush(heap, (score, self.expanded_states, ranks, pivot))
+            self.expanded_states += 1
+
+        heap: List[Tuple[float, int, Tuple[int, ...], int]] = []
+        push(heap, (0,) * num_stages, 0)
+
+        while heap:
+            score, _, ranks, pivot = heapq.heappop(heap)
+
+            if context is not None:
+                try:
+                    context.register_evaluation()
+                except BudgetExceeded:
+                    return
+
+            for stage in range(pivot, num_stages):
+                if ranks[stage] + 1 < space.radices[stage]:
+                    child = ranks[:stage] + (ranks[stage] + 1,) + ranks[stage + 1:]
+                    push(heap, child, stage)
+
+            indices = tuple(order[stage][rank] for stage, rank in enumerate(ranks))
+            total_cost, total_latency, _ = space.objectives(indices)
+
+            if space.is_feasible(task, total_cost, total_latency):
+                yield score, indices
+
+    @staticmethod
+    def _suffix_min(values: List[float], ranking: List[int]) -> List[float]:
+        minima = [0.0] * len(ranking)
+        current = float("inf")
+
+        for rank in range(len(ranking) - 1, -1, -1):
+            current = min(current, values[ranking[rank]])
+            minima[rank] = current
+
+        return minima
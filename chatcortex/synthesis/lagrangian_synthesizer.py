@@ -0,0 +1,382 @@
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from chatcortex.optimization.architecture_candidate import ArchitectureCandidate
+from chatcortex.synthesis.base import Synthesizer
+from chatcortex.synthesis.budget import BudgetExceeded, SynthesisBudget, SynthesisContext
+from chatcortex.synthesis.heuristic_synthesizer import SynthesisError
+from chatcortex.synthesis.search_space import ChainSearchSpace
+from chatcortex.synthesis.task_specification import TaskSpecification
+
+
+@dataclass
+class LagrangianResult:
+    """
+    Outcome of LagrangianSynthesizer.solve()
+
+    candidate: best feasible architecture found (None if none was found
+               before the budget ran out)
+    score: its weighted score (lower is better)
+    lower_bound: best Lagrangian dual bound, no feasible architecture
+                 scores lower
+    gap: score - lower_bound (inf without a candidate)
+    multipliers: final (cost, latency) multipliers, on constraints
+                 normalized by their limits
+    iterations: subgradient iterations run
+    """
+
+    candidate: Optional[ArchitectureCandidate]
+    score: float
+    lower_bound: float
+    gap: float
+    multipliers: Tuple[float, float]
+    iterations: int
+
+
+class LagrangianSynthesizer(Synthesizer):
+    """
+    Constrained single-architecture synthesis by Lagrangian relaxation
+
+    Minimizes the HeuristicSynthesizer score summed over stages subject
+    to max_cost and max_latency. Relaxing both constraints with
+    multipliers (cost, latency) >= 0 gives
+
+        L(m) = min_x score(x) + m_cost * (cost(x) / max_cost - 1)
+                              + m_latency * (latency(x) / max_latency - 1)
+
+    whose minimizer is a per-stage argmin. Every L(m) is a lower bound on
+    the constrained optimum. Multipliers follow projected subgradient
+    steps with the Polyak step size
+
+        step = theta * (best score - L(m)) / |subgradient|^2
+
+    where theta is halved after `patience` iterations without a better
+    bound.
+
+    Primal solutions: each iterate is made feasible by greedy repair
+    (the swap removing the most constraint violation per unit of score),
+    then improved by score-decreasing feasible swaps. The search stops
+    when the relative gap is below tolerance.
+
+    Raises SynthesisError when no feasible architecture is found, and
+    returns [] when the budget is exhausted first, like
+    HeuristicSynthesizer.
+
+    Budget:
+        One evaluation per iteration. With an evaluator, one evaluation is
+        reserved for re-scoring the final architecture, which must still
+        be feasible ([] if the budget runs out before it is re-scored).
+    """
+
+    def __init__(
+        self,
+        registry,
+        max_iterations: int = 200,
+        tolerance: float = 1e-4,
+        patience: int = 5,
+        archive_factory=None,
+        evaluator=None,
+    ):
+        super().__init__(registry, archive_factory=archive_factory, evaluator=evaluator)
+
+        if max_iterations < 1:
+            raise ValueError("max_iterations must be positive")
+
+        self.max_iterations = max_iterations
+        self.tolerance = tolerance
+        self.patience = patience
+
+    def synthesize(
+        self,
+        task: TaskSpecification,
+        budget: Optional[SynthesisBudget] = None,
+    ) -> List[ArchitectureCandidate]:
+
+        context = SynthesisContext(budget)
+        reserve = 0 if self.evaluator is None else 1
+        result = self._solve(task, context, reserve)
+
+        if result.candidate is None:
+            exhausted = not context.can_evaluate() or (
+                budget is not None
+                and budget.max_evaluations is not None
+                and context.evaluations >= budget.max_evaluations - reserve
+            )
+            if result.iterations == 0 or exhausted:
+                return []
+            raise SynthesisError("No feasible architecture found under the given constraints")
+
+        if self.evaluator is None:
+            return [result.candidate]
+
+        graph = result.candidate.graph
+        components = [graph.get_metadata(node) for node in graph.get_execution_order()]
+        evaluated = self.evaluator.evaluate_batch([components], context)
+
+        if not evaluated:
+            return []
+
+        objectives = evaluated[0]
+
+        if objectives is None:
+            raise SynthesisError("Constructed agent was discarded by the evaluator")
+
+        if (
+            (task.max_cost is not None and objectives[0] > task.max_cost)
+            or (task.max_latency is not None and objectives[1] > task.max_latency)
+        ):
+            raise SynthesisError("Evaluated agent violates the task constraints")
+
+        return [
+            ArchitectureCandidate(
+                graph=result.candidate.graph,
+                total_cost=objectives[0],
+                total_latency=objectives[1],
+                total_reliability=objectives[2],
+            )
+        ]
+
+    def solve(
+        self,
+        task: TaskSpecification,
+        budget: Optional[SynthesisBudget] = None,
+    ) -> LagrangianResult:
+        """
+        Best feasible architecture with its dual bound and gap
+        """
+
+        return self._solve(task, SynthesisContext(budget))
+
+    def _solve(
+        self,
+        task: TaskSpecification,
+        context: SynthesisContext,
+        reserve: int = 0,
+    ) -> LagrangianResult:
+        """
+        Subgradient search, leaving reserve evaluations of the budget unused
+        """
+
+        task.validate()
+
+        space = ChainSearchSpace.from_task(self.registry, task)
+        weights = task.objective_weights
+
+        if space.is_empty:
+            raise SynthesisError("No components available for some capability under given constraints")
+
+        scores = [
+            weights["cost"] * space.cost_arrays[stage]
+            + weights["latency"] * space.latency_arrays[stage]
+            - weights["error"] * space.reliability_arrays[stage]
+            for stage in range(space.num_stages)
+        ]
+
+        # Constraints normalized by their limits: usage / limit - 1 <= 0
+        limits = np.array([
+            np.inf if task.max_cost is None else task.max_cost,
+            np.inf if task.max_latency is None else task.max_latency,
+        ])
+        active = np.isfinite(limits)
+        scales = np.where(active & (limits > 0), 1.0 / np.where(limits > 0, limits, 1.0), 1.0)
+        usage = [
+            np.column_stack((space.cost_arrays[stage], space.latency_arrays[stage])) * scales
+            for stage in range(space.num_stages)
+        ]
+        bounds = np.where(active, limits * scales, 0.0)
+
+        def score_of(indices) -> float:
+            return float(sum(scores[stage][idx] for stage, idx in enumerate(indices)))
+
+        def feasible(indices) -> bool:
+            total_cost, total_latency, _ = space.objectives(indices)
+            return space.is_feasible(task, total_cost, total_latency)
+
+        multipliers = np.zeros(2)
+        lower_bound = -np.inf
+        best: Optional[Tuple[float, Tuple[int, ...]]] = None
+
+        # Any architecture scores at most this (step size before a
+        # feasible architecture is known)
+        worst_score = float(sum(stage_scores.max() for stage_scores in scores))
+
+        theta = 2.0
+        stall = 0
+        iterations = 0
+
+        max_evaluations = context.budget.max_evaluations if context.budget else None
+        if max_evaluations is not None:
+            max_evaluations -= reserve
+
+        for _ in range(self.max_iterations):
+            if max_evaluations is not None and context.evaluations >= max_evaluations:
+                break
+
+            try:
+                context.register_evaluation()
+            except BudgetExceeded:
+                break
+
+            iterations += 1
+
+            relaxed = [
+                scores[stage] + usage[stage][:, active] @ multipliers[active]
+                for stage in range(space.num_stages)
+            ]
+            indices = tuple(int(np.argmin(values)) for values in relaxed)
+
+            dual = float(sum(values[idx] for values, idx in zip(relaxed, indices)))
+            dual -= float(multipliers[active] @ bounds[active])
+
+            if dual > lower_bound:
+                lower_bound = dual
+                stall = 0
+            else:
+                stall += 1
+                if stall >= self.patience:
+                    theta /= 2.0
+                    stall = 0
+
+            primal = indices if feasible(indices) else self._repair(space, task, scores, indices)
+
+            if primal is not None:
+                primal = self._improve(space, task, scores, primal)
+                primal_score = score_of(primal)
+
+                if best is None or primal_score < best[0]:
+                    best = (primal_score, primal)
+
+            if best is not None and best[0] - lower_bound <= self.tolerance * max(1.0, abs(best[0])):
+                break
+
+            subgradient = np.zeros(2)
+            totals = sum(usage[stage][idx] for stage, idx in enumerate(indices))
+            subgradient[active] = totals[active] - bounds[active]
+
+            # Projection: multipliers at zero cannot decrease
+            subgradient[(multipliers <= 0) & (subgradient < 0)] = 0.0
+            norm = float(subgradient @ subgradient)
+
+            if norm == 0.0:
+                break
+
+            target = best[0] if best is not None else worst_score
+            step = theta * max(target - dual, 0.0) / norm
+
+            if step == 0.0:
+                break
+
+            multipliers = np.maximum(0.0, multipliers + step * subgradient)
+
+        if best is None:
+            return LagrangianResult(
+                candidate=None,
+                score=np.inf,
+                lower_bound=lower_bound,
+                gap=np.inf,
+                multipliers=tuple(multipliers.tolist()),
+                iterations=iterations,
+            )
+
+        return LagrangianResult(
+            candidate=space.to_candidate(best[1]),
+            score=best[0],
+            lower_bound=lower_bound,
+            gap=best[0] - lower_bound,
+            multipliers=tuple(multipliers.tolist()),
+            iterations=iterations,
+        )
+
+    @staticmethod
+    def _violation(space: ChainSearchSpace, task: TaskSpecification, indices) -> float:
+        total_cost, total_latency, _ = space.objectives(indices)
+        violation = 0.0
+
+        if task.max_cost is not None and total_cost > task.max_cost:
+            violation += (total_cost - task.max_cost) / max(task.max_cost, 1e-12)
+
+        if task.max_latency is not None and total_latency > task.max_latency:
+            violation += (total_latency - task.max_latency) / max(task.max_latency, 1e-12)
+
+        return violation
+
+    def _repair(
+        self,
+        space: ChainSearchSpace,
+        task: TaskSpecification,
+        scores: List[np.ndarray],
+        indices: Tuple[int, ...],
+    ) -> Optional[Tuple[int, ...]]:
+        """
+        Greedy repair: apply the single-stage swap with the best
+        violation reduction per score increase until feasible
+        """
+
+        current = list(indices)
+        violation = self._violation(space, task, current)
+
+        while violation > 0.0:
+            best_move, best_ratio, best_violation = None, np.inf, violation
+
+            for stage in range(space.num_stages):
+                for idx in range(space.radices[stage]):
+                    if idx == current[stage]:
+                        continue
+
+                    trial = current[:stage] + [idx] + current[stage + 1:]
+                    trial_violation = self._violation(space, task, trial)
+                    reduction = violation - trial_violation
+
+                    if reduction <= 0.0:
+                        continue
+
+                    increase = max(scores[stage][idx] - scores[stage][current[stage]], 0.0)
+                    ratio = increase / reduction
+
+                    if ratio < best_ratio or (ratio == best_ratio and trial_violation < best_violation):
+                        best_move, best_ratio, best_violation = (stage, idx), ratio, trial_violation
+
+            if best_move is None:
+                return None
+
+            current[best_move[0]] = best_move[1]
+            violation = best_violation
+
+        return tuple(current)
+
+    @staticmethod
+    def _improve(
+        space: ChainSearchSpace,
+        task: TaskSpecification,
+        scores: List[np.ndarray],
+        indices: Tuple[int, ...],
+    ) -> Tuple[int, ...]:
+        """
+        Apply the best score-decreasing feasible single-stage swap until
+        none is left
+        """
+
+        current = list(indices)
+
+        while True:
+            best_move, best_gain = None, 0.0
+
+            for stage in range(space.num_stages):
+                for idx in np.flatnonzero(scores[stage] < scores[stage][current[stage]]).tolist():
+                    gain = scores[stage][current[stage]] - scores[stage][idx]
+
+                    if gain <= best_gain:
+                        continue
+
+                    trial = current[:stage] + [idx] + current[stage + 1:]
+                    total_cost, total_latency, _ = space.objectives(trial)
+
+                    if space.is_feasible(task, total_cost, total_latency):
+                        best_move, best_gain = (stage, idx), gain
+
+            if best_move is None:
+                return tuple(current)
+
+            current[best_move[0]] = best_move[1]
@@ -0,0 +1,279 @@
+from collections import deque
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from chatcortex.optimization.architecture_candidate import ArchitectureCandidate
+from chatcortex.optimization.vectorized import dominance_matrix, non_dominated_mask
+from chatcortex.synthesis.base import Synthesizer
+from chatcortex.synthesis.budget import BudgetExceeded, SynthesisBudget, SynthesisContext
+from chatcortex.synthesis.search_space import ChainSearchSpace
+from chatcortex.synthesis.task_specification import TaskSpecification
+from chatcortex.synthesis.weight_sweep_synthesizer import WeightSweepSynthesizer
+
+
+Genome = Tuple[int, ...]
+Objectives = Tuple[float, float, float]
+
+
+class ParetoLocalSearchSynthesizer(Synthesizer):
+    """
+    Pareto local search over single-stage component swaps
+
+    Starts from an archive of seed architectures and repeatedly explores
+    an unexplored archive member: every architecture differing from it in
+    exactly one stage is scored, and feasible neighbors not dominated by
+    the archive enter it (evicting members they dominate) as unexplored.
+    The search ends when every archive member has been explored.
+
+    Neighbor objectives are delta updates of the parent's objectives:
+    swapping stage s from component a to b adds cost_b - cost_a and
+    latency_b - latency_a and multiplies reliability by r_b / r_a, so each
+    neighbor costs O(1) instead of a graph build (a whole neighborhood is
+    scored with a few NumPy operations). Objectives of the final
+    architectures are recomputed exactly.
+
+    seeder:
+        Callable (space, task) -> genomes (component index per stage).
+        Defaults to the supported points of WeightSweepSynthesizer plus
+        the HeuristicSynthesizer choice. Infeasible seeds are skipped.
+
+    max_expansions:
+        Optional cap on explored archive members
+
+    Budget:
+        One evaluation per distinct architecture scored (seeds and
+        neighbors, revisits are free). With an evaluator, the search uses
+        the static metrics without charge (it still stops on the time
+        limit) and one evaluation is charged per final archive member
+        submitted to the evaluator; members past the budget are dropped.
+    """
+
+    def __init__(
+        self,
+        registry,
+        seeder: Optional[Callable[[ChainSearchSpace, TaskSpecification], List[Genome]]] = None,
+        max_expansions: Optional[int] = None,
+        archive_factory=None,
+        evaluator=None,
+    ):
+        super().__init__(registry, archive_factory=archive_factory, evaluator=evaluator)
+        self.seeder = seeder
+        self.max_expansions = max_expansions
+
+    def _default_seeds(self, space: ChainSearchSpace, task: TaskSpecification) -> List[Genome]:
+        weights = task.objective_weights
+
+        greedy = tuple(
+            int(np.argmin(
+                weights["cost"] * space.cost_arrays[stage]
+                + weights["latency"] * space.latency_arrays[stage]
+                - weights["error"] * space.reliability_arrays[stage]
+            ))
+            for stage in range(space.num_stages)
+        )
+
+        return WeightSweepSynthesizer(self.registry).seed_genomes(space, task) + [greedy]
+
+    def synthesize(
+        self,
+        task: TaskSpecification,
+        budget: Optional[SynthesisBudget] = None,
+    ) -> List[ArchitectureCandidate]:
+
+        task.validate()
+
+        context = SynthesisContext(budget)
+        space = ChainSearchSpace.from_task(self.registry, task)
+
+        if space.is_empty:
+            return []
+
+        seeder = self.seeder or self._default_seeds
+        archive = self._search(
+            space,
+            task,
+            context,
+            [tuple(g) for g in seeder(space, task)],
+            charge=self.evaluator is None,
+        )
+
+        genomes = list(archive)
+        pareto_set = self._new_archive()
+
+        if self.evaluator is not None:
+            evaluated = self.evaluator.evaluate_batch(
+                [space.components(genome) for genome in genomes], context
+            )
+        else:
+            evaluated = [space.objectives(genome) for genome in genomes]
+
+        for genome, objectives in zip(genomes, evaluated):
+            if objectives is None or not space.is_feasible(task, objectives[0], objectives[1]):
+                continue
+
+            pareto_set.add(space.to_candidate(genome, objectives))
+
+        return list(pareto_set)
+
+    def _search(
+        self,
+        space: ChainSearchSpace,
+        task: TaskSpecification,
+        context: SynthesisContext,
+        seeds: List[Genome],
+        charge: bool = True,
+    ) -> Dict[Genome, Objectives]:
+        """
+        Run the local search and return the archive (genome -> delta
+        objectives)
+
+        charge: register scored architectures with context (otherwise
+        only the time limit applies)
+        """
+
+        archive: Dict[Genome, Objectives] = {}
+        unexplored = deque()
+        seen = set()
+
+        def insert(genomes: List[Genome], objectives: np.ndarray) -> None:
+            # Drop candidates dominated by each other or by the archive
+            keep = non_dominated_mask(objectives)
+            genomes = [g for g, k in zip(genomes, keep.tolist()) if k]
+            objectives = objectives[keep]
+
+            if archive:
+                members = list(archive)
+                current = np.array([archive[g] for g in members], dtype=float)
+
+                keep = ~dominance_matrix(current, objectives).any(axis=0)
+                genomes = [g for g, k in zip(genomes, keep.tolist()) if k]
+                objectives = objectives[keep]
+
+                if not genomes:
+                    return
+
+                evicted = dominance_matrix(objectives, current).any(axis=0)
+                for genome, evict in zip(members, evicted.tolist()):
+                    if evict:
+                        del archive[genome]
+
+            for genome, values in zip(genomes, objectives.tolist()):
+                archive[genome] = tuple(values)
+                unexplored.append(genome)
+
+        def register(count: int) -> int:
+            """
+            Charge up to count evaluations, return how many were allowed
+            """
+
+            if not charge:
+                return count if context.within_time_limit() else 0
+
+            for done in range(count):
+                try:
+                    context.register_evaluation()
+                except BudgetExceeded:
+                    return done
+            return count
+
+        # Seeds
+        seeds = [g for g in dict.fromkeys(seeds) if len(g) == space.num_stages]
+        seeds = seeds[: register(len(seeds))]
+        seen.update(seeds)
+
+        seed_objectives = [space.objectives(g) for g in seeds]
+        feasible = [
+            (g, o) for g, o in zip(seeds, seed_objectives)
+            if space.is_feasible(task, o[0], o[1])
+        ]
+
+        if feasible:
+            insert([g for g, _ in feasible], np.array([o for _, o in feasible], dtype=float))
+
+        expansions = 0
+
+        while unexplored:
+            if self.max_expansions is not None and expansions >= self.max_expansions:
+                break
+
+            parent = unexplored.popleft()
+
+            if parent not in archive:
+                continue # Evicted before being explored
+
+            expansions += 1
+            neighbors, objectives = self._neighborhood(space, parent, archive[parent])
+
+            fresh = [i for i, genome in enumerate(neighbors) if genome not in seen]
+            allowed = register(len(fresh))
+            fresh = fresh[:allowed]
+
+            neighbors = [neighbors[i] for i in fresh]
+            objectives = objectives[fresh]
+            seen.update(neighbors)
+
+            mask = np.ones(len(neighbors), dtype=bool)
+            if task.max_cost is not None:
+                mask &= objectives[:, 0] <= task.max_cost
+            if task.max_latency is not None:
+                mask &= objectives[:, 1] <= task.max_latency
+
+            if mask.any():
+                insert([g for g, k in zip(neighbors, mask.tolist()) if k], objectives[mask])
+
+            if not context.can_evaluate():
+                break
+
+        return archive
+
+    @staticmethod
+    def _neighborhood(
+        space: ChainSearchSpace,
+        genome: Genome,
+        objectives: Objectives,
+    ) -> Tuple[List[Genome], np.ndarray]:
+        """
+        All single-stage swaps of genome with delta-updated objectives
+        """
+
+        total_cost, total_latency, total_reliability = objectives
+
+        neighbors: List[Genome] = []
+        blocks = []
+
+        for stage, current in enumerate(genome):
+            radix = space.radices[stage]
+
+            if radix < 2:
+                continue
+
+            others = np.array([idx for idx in range(radix) if idx != current])
+
+            costs = space.cost_arrays[stage]
+            latencies = space.latency_arrays[stage]
+            reliabilities = space.reliability_arrays[stage]
+
+            if reliabilities[current] > 0:
+                reliability = total_reliability / reliabilities[current] * reliabilities[others]
+            else:
+                # Cannot divide out a zero factor: recompute the product
+                rest = 1.0
+                for other_stage, idx in enumerate(genome):
+                    if other_stage != stage:
+                        rest *= space.reliabilities[other_stage][idx]
+                reliability = rest * reliabilities[others]
+
+            blocks.append(np.column_stack((
+                total_cost - costs[current] + costs[others],
+                total_latency - latencies[current] + latencies[others],
+                reliability,
+            )))
+
+            prefix, suffix = genome[:stage], genome[stage + 1:]
+            neighbors.extend(prefix + (int(idx),) + suffix for idx in others)
+
+        if not blocks:
+            return [], np.zeros((0, 3))
+
+        return neighbors, np.concatenate(blocks)
@@ -0,0 +1,177 @@
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional, Sequence, Tuple
+
+from chatcortex.registry.capability_registry import CapabilityRegistry
+from chatcortex.registry.metadata import PrivacyLevel
+
+
+# Front layers of a prefix: layers[k] is the front after k stages
+Layers = Tuple[Tuple[Hashable, ...], ...]
+
+CacheKey = Tuple[Tuple[str, ...], Optional[PrivacyLevel], int]
+
+
+class _TrieNode:
+    __slots__ = ("children", "layers", "parent", "capability")
+
+    def __init__(self, parent: Optional["_TrieNode"] = None, capability: Optional[str] = None):
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.layers: Optional[Layers] = None
+        self.parent = parent
+        self.capability = capability
+
+
+class PrefixFrontCache:
+    """
+    LRU cache of partial Pareto fronts keyed by capability prefix
+
+    Key: (capability prefix, privacy constraint, registry version)
+
+    Entries live in a trie per (privacy constraint, registry version), so
+    the longest cached prefix of a task is found in one walk. Registering
+    a component bumps the registry version, which makes older entries
+    unreachable (they age out through LRU eviction).
+
+    Cached fronts must not depend on task constraints (max_cost,
+    max_latency); callers apply those to the final front.
+
+    max_states:
+        Memory cap, counted in cached front states over all entries.
+        Layers shared between entries are counted once per entry, so
+        the cap is conservative. Least recently used entries are evicted
+        first, and an entry larger than the cap is not stored.
+
+    A cache serves a single registry.
+    """
+
+    def __init__(self, max_states: int = 1_000_000):
+        if max_states < 1:
+            raise ValueError("max_states must be positive")
+
+        self.max_states = max_states
+        self.num_states = 0
+        self.hits = 0
+        self.misses = 0
+
+        self._roots: Dict[Tuple[Optional[PrivacyLevel], int], _TrieNode] = {}
+        self._lru: "OrderedDict[CacheKey, _TrieNode]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._lru)
+
+    @staticmethod
+    def key(
+        registry: CapabilityRegistry,
+        capabilities: Sequence[str],
+        privacy_constraint: Optional[PrivacyLevel],
+    ) -> CacheKey:
+        return (tuple(capabilities), privacy_constraint, registry.version)
+
+    @staticmethod
+    def _size(layers: Layers) -> int:
+        return sum(len(layer) for layer in layers)
+
+    def longest_prefix(
+        self,
+        registry: CapabilityRegistry,
+        capabilities: Sequence[str],
+        privacy_constraint: Optional[PrivacyLevel],
+    ) -> Tuple[int, Optional[Layers]]:
+        """
+        Longest cached prefix of capabilities
+
+        Returns (prefix length, layers), or (0, None) on a miss.
+        """
+
+        node = self._roots.get((privacy_constraint, registry.version))
+        best_length, best_node = 0, None
+
+        if node is not None:
+            for length, capability in enumerate(capabilities, start=1):
+                node = node.children.get(capability)
+                if node is None:
+                    break
+                if node.layers is not None:
+                    best_length, best_node = length, node
+
+        if best_node is None:
+            self.misses += 1
+            return 0, None
+
+        self.hits += 1
+        self._lru.move_to_end(
+            self.key(registry, capabilities[:best_length], privacy_constraint)
+        )
+        return best_length, best_node.layers
+
+    def get(
+        self,
+        registry: CapabilityRegistry,
+        capabilities: Sequence[str],
+        privacy_constraint: Optional[PrivacyLevel],
+    ) -> Optional[Layers]:
+        """
+        Layers cached for exactly this prefix, or None
+        """
+
+        key = self.key(registry, capabilities, privacy_constraint)
+        node = self._lru.get(key)
+
+        if node is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._lru.move_to_end(key)
+        return node.layers
+
+    def put(
+        self,
+        registry: CapabilityRegistry,
+        capabilities: Sequence[str],
+        privacy_constraint: Optional[PrivacyLevel],
+        layers: Sequence[Sequence[Hashable]],
+    ) -> None:
+
+        layers = tuple(tuple(layer) for layer in layers)
+        size = self._size(layers)
+
+        if not capabilities or size > self.max_states:
+            return
+
+        key = self.key(registry, capabilities, privacy_constraint)
+
+        if key in self._lru:
+            self._remove(key)
+
+        node = self._roots.setdefault((privacy_constraint, registry.version), _TrieNode())
+        for capability in capabilities:
+            child = node.children.get(capability)
+            if child is None:
+                child = node.children[capability] = _TrieNode(node, capability)
+            node = child
+
+        node.layers = layers
+        self._lru[key] = node
+        self.num_states += size
+
+        while self.num_states > self.max_states:
+            self._remove(next(iter(self._lru)))
+
+    def clear(self) -> None:
+        self._roots.clear()
+        self._lru.clear()
+        self.num_states = 0
+
+    def _remove(self, key: CacheKey) -> None:
+        node = self._lru.pop(key)
+        self.num_states -= self._size(node.layers)
+        node.layers = None
+
+        # Drop trie nodes that no longer lead to any entry
+        while node.parent is not None and node.layers is None and not node.children:
+            del node.parent.children[node.capability]
+            node = node.parent
+
+        if node.parent is None and not node.children:
+            self._roots.pop((key[1], key[2]), None)
@@ -1,11 +1,23 @@
 import random
-from typing import List
+from typing import Iterator, List, Optional
+
+import numpy as np
 
 from chatcortex.graph.agent_graph import AgentGraph
-from chatcortex.optimization.architecture_candidate import ArchitectureCandidate
+from chatcortex.optimization.architecture_candidate import ArchitectureCandidate, CompactCandidate
 from chatcortex.optimization.pareto import ParetoSet
+from chatcortex.optimization.vectorized import non_dominated_mask
+from chatcortex.registry.capability_registry import CapabilityRegistry
 from chatcortex.synthesis.base import Synthesizer
 from chatcortex.synthesis.budget import BudgetExceeded, SynthesisBudget, SynthesisContext
+from chatcortex.synthesis.checkpoint import (
+    SearchCheckpoint,
+    compact_archive,
+    load_checkpoint,
+    save_checkpoint,
+    stage_names,
+)
+from chatcortex.synthesis.search_space import ChainSearchSpace
 from chatcortex.synthesis.task_specification import TaskSpecification
 
 
@@ -16,8 +28,64 @@ class RandomSynthesizer(Synthesizer):
     v0.3.0 baseline strategy
         - Uniformly samples architectures under evaluation budget
         - maintains incremental Pareto frontier
+
+    Batch mode (batch_size set):
+        - draws batches of component indices with a NumPy Generator
+          seeded from SynthesisBudget.random_seed
+        - unique=True samples without replacement in mixed-radix index
+          space and never evaluates an architecture twice. With
+          max_evaluations set (and size < 2**63), min(size,
+          max_evaluations) distinct indices are drawn up front
+          (Generator.choice, memory linear in the draws). Otherwise
+          draws are rejection-sampled against the set of seen
+          architectures, which grows with every draw and slows down like
+          coupon collecting as the space nears exhaustion; rejected
+          duplicates do not count against the budget
+        - scores each batch vectorized and only materializes graphs for
+          the architectures left in the final archive
+
+    checkpoint_path (sequential mode):
+        Every checkpoint_interval evaluations, and when the run ends, the
+        RNG state, evaluation count and archive are written to this file.
+        resume(path, budget) continues the same random sequence;
+        max_evaluations counts evaluations over all runs.
+
+    evaluator (sequential mode):
+        Draws are submitted in batches of evaluator.batch_size
     """
 
+    def __init__(
+        self,
+        registry: CapabilityRegistry,
+        batch_size: Optional[int] = None,
+        unique: bool = False,
+        checkpoint_path: Optional[str] = None,
+        checkpoint_interval: int = 10000,
+        archive_factory=None,
+        evaluator=None,
+    ):
+        super().__init__(registry, archive_factory=archive_factory, evaluator=evaluator)
+
+        if batch_size is not None and batch_size < 1:
+            raise ValueError("batch_size must be positive")
+
+        if unique and batch_size is None:
+            raise ValueError("unique sampling requires batch mode (batch_size)")
+
+        if checkpoint_path is not None and batch_size is not None:
+            raise ValueError("Checkpointing is only supported in sequential mode")
+
+        if checkpoint_interval < 1:
+            raise ValueError("checkpoint_interval must be positive")
+
+        if evaluator is not None and (batch_size is not None or checkpoint_path is not None):
+            raise ValueError("evaluator is only supported in sequential mode")
+
+        self.batch_size = batch_size
+        self.unique = unique
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint_interval = checkpoint_interval
+
     def synthesize(
         self, 
         task: TaskSpecification, 
@@ -26,8 +94,46 @@ class RandomSynthesizer(Synthesizer):
 
         task.validate()
 
+        if self.batch_size is not None:
+            return self._synthesize_batched(task, budget)
+
+        if self.checkpoint_path is not None:
+            return self._synthesize_checkpointed(task, budget, self.checkpoint_path)
+
         context = SynthesisContext(budget)
-        pareto_set = ParetoSet()
+        pareto_set = self._new_archive()
+
+        for _ in self._sequential_steps(task, budget, context, pareto_set):
+            pass
+
+        return list(pareto_set)
+
+    def _search(
+        self,
+        task: TaskSpecification,
+        budget: Optional[SynthesisBudget],
+        context: SynthesisContext,
+        archive: ParetoSet,
+    ) -> Optional[Iterator[bool]]:
+        if self.batch_size is not None or self.checkpoint_path is not None:
+            return None
+        return self._sequential_steps(task, budget, context, archive)
+
+    def _sequential_steps(
+        self,
+        task: TaskSpecification,
+        budget: Optional[SynthesisBudget],
+        context: SynthesisContext,
+        pareto_set: ParetoSet,
+    ) -> Iterator[bool]:
+        """
+        Sequential sampling loop, yields after every evaluation whether
+        the archive changed
+        """
+
+        if self.evaluator is not None:
+            yield from self._evaluated_sequential_steps(task, budget, context, pareto_set)
+            return
 
         random_number_generation = random.Random(budget.random_seed if budget else None)
 
@@ -40,7 +146,7 @@ class RandomSynthesizer(Synthesizer):
             )
 
             if not candidates:
-                return []
+                return
 
             candidates_list.append(candidates)
 
@@ -72,9 +178,11 @@ class RandomSynthesizer(Synthesizer):
             total_reliability = graph.aggregate_reliability()
 
             if task.max_cost is not None and total_cost > task.max_cost:
+                yield False
                 continue
 
             if task.max_latency is not None and total_latency > task.max_latency:
+                yield False
                 continue
 
             candidate = ArchitectureCandidate(
@@ -84,6 +192,259 @@ class RandomSynthesizer(Synthesizer):
                 total_reliability=total_reliability,
             )        
 
-            pareto_set.add(candidate=candidate)
-                
-        return list(pareto_set)
\ No newline at end of file
+            yield pareto_set.add(candidate=candidate)
+
+    def _evaluated_sequential_steps(
+        self,
+        task: TaskSpecification,
+        budget: Optional[SynthesisBudget],
+        context: SynthesisContext,
+        pareto_set: ParetoSet,
+    ) -> Iterator[bool]:
+        """
+        Sequential sampling submitting evaluator.batch_size draws at a time
+        (same draw sequence as without an evaluator)
+        """
+
+        random_number_generation = random.Random(budget.random_seed if budget else None)
+
+        space = ChainSearchSpace.from_task(self.registry, task)
+
+        if space.is_empty:
+            return
+
+        while context.can_evaluate():
+
+            size = self.evaluator.batch_size
+            if budget is not None and budget.max_evaluations is not None:
+                size = min(size, budget.max_evaluations - context.evaluations)
+
+            batch = [
+                [random_number_generation.choice(candidates) for candidates in space.stage_candidates]
+                for _ in range(size)
+            ]
+
+            evaluated = self.evaluator.evaluate_batch(batch, context)
+
+            for components, objectives in zip(batch, evaluated):
+                if objectives is None or not space.is_feasible(task, objectives[0], objectives[1]):
+                    yield False
+                    continue
+
+                yield pareto_set.add(
+                    ArchitectureCandidate(
+                        graph=AgentGraph.from_chain(components),
+                        total_cost=objectives[0],
+                        total_latency=objectives[1],
+                        total_reliability=objectives[2],
+                    )
+                )
+
+            if len(evaluated) < len(batch):
+                return # Budget exhausted
+
+    def resume(
+        self,
+        path: str,
+        budget: Optional[SynthesisBudget] = None,
+    ) -> List[ArchitectureCandidate]:
+        """
+        Continue a checkpointed sequential run
+
+        Later checkpoints go to checkpoint_path if set, else back to path.
+        """
+
+        checkpoint = load_checkpoint(path)
+
+        if checkpoint.synthesizer != type(self).__name__:
+            raise ValueError(f"Checkpoint was written by {checkpoint.synthesizer}")
+
+        return self._synthesize_checkpointed(
+            checkpoint.task, budget, self.checkpoint_path or path, checkpoint
+        )
+
+    def _synthesize_checkpointed(
+        self,
+        task: TaskSpecification,
+        budget: Optional[SynthesisBudget],
+        path: str,
+        checkpoint: Optional[SearchCheckpoint] = None,
+    ) -> List[ArchitectureCandidate]:
+        """
+        Sequential sampling with periodic checkpoints
+
+        Draws the same architectures as the plain sequential mode for a
+        given seed. The budget is checked before drawing, so the saved RNG
+        state continues the sequence exactly.
+        """
+
+        context = SynthesisContext(budget)
+        pareto_set = self._new_archive()
+
+        random_number_generation = random.Random(budget.random_seed if budget else None)
+
+        space = ChainSearchSpace.from_task(self.registry, task)
+
+        if checkpoint is not None:
+            checkpoint.check_space(space)
+            checkpoint.restore_archive(self.registry, pareto_set)
+            context.evaluations = checkpoint.evaluations
+
+            version, internal_state, gauss_next = checkpoint.rng_state
+            random_number_generation.setstate((version, tuple(internal_state), gauss_next))
+
+        if space.is_empty:
+            return []
+
+        def save():
+            save_checkpoint(path, SearchCheckpoint(
+                synthesizer=type(self).__name__,
+                task=task,
+                stages=stage_names(space),
+                evaluations=context.evaluations,
+                archive=compact_archive(pareto_set),
+                rng_state=random_number_generation.getstate(),
+            ))
+
+        while context.can_evaluate():
+
+            combination = [
+                random_number_generation.choice(candidates)
+                for candidates in space.stage_candidates
+            ]
+
+            try:
+                context.register_evaluation()
+            except BudgetExceeded:
+                break
+
+            graph = AgentGraph.from_chain(combination)
+
+            total_cost = graph.total_cost()
+            total_latency = graph.total_latency()
+
+            if space.is_feasible(task, total_cost, total_latency):
+                pareto_set.add(
+                    ArchitectureCandidate(
+                        graph=graph,
+                        total_cost=total_cost,
+                        total_latency=total_latency,
+                        total_reliability=graph.aggregate_reliability(),
+                    )
+                )
+
+            if context.evaluations % self.checkpoint_interval == 0:
+                save()
+
+        save()
+
+        return list(pareto_set)
+
+    def _synthesize_batched(
+        self,
+        task: TaskSpecification,
+        budget: Optional[SynthesisBudget],
+    ) -> List[ArchitectureCandidate]:
+
+        context = SynthesisContext(budget)
+        pareto_set = self._new_archive()
+
+        space = ChainSearchSpace.from_task(self.registry, task)
+
+        if space.is_empty:
+            return []
+
+        random_number_generator = np.random.default_rng(
+            budget.random_seed if budget else None
+        )
+
+        radices = np.asarray(space.radices, dtype=np.int64)
+        use_integer_keys = space.size < 2 ** 63
+        seen = set()
+
+        # Distinct indices drawn directly when the number of draws is bounded
+        pending = None
+        if (
+            self.unique
+            and use_integer_keys
+            and budget is not None
+            and budget.max_evaluations is not None
+        ):
+            pending = random_number_generator.choice(
+                space.size,
+                size=min(space.size, budget.max_evaluations),
+                replace=False,
+            )
+        position = 0
+
+        while context.can_evaluate():
+
+            if self.unique and len(seen) >= space.size:
+                break # space exhausted
+
+            size = self.batch_size
+            if budget is not None and budget.max_evaluations is not None:
+                size = min(size, budget.max_evaluations - context.evaluations)
+
+            if pending is not None:
+                if position >= len(pending):
+                    break # all draws evaluated
+
+                digits = space.digits_batch(pending[position : position + size])
+                position += len(digits)
+
+            else:
+                digits = random_number_generator.integers(
+                    0, radices, size=(size, space.num_stages)
+                )
+
+            if self.unique and pending is None:
+                keys = (
+                    space.encode_batch(digits).tolist()
+                    if use_integer_keys
+                    else [tuple(row) for row in digits.tolist()]
+                )
+
+                fresh = []
+                for row, key in enumerate(keys):
+                    if key not in seen:
+                        seen.add(key)
+                        fresh.append(row)
+
+                digits = digits[fresh]
+
+            digits = digits[: self._register_evaluations(context, len(digits))]
+
+            objectives = space.objectives_batch(digits)
+
+            feasible = np.ones(len(digits), dtype=bool)
+            if task.max_cost is not None:
+                feasible &= objectives[:, 0] <= task.max_cost
+            if task.max_latency is not None:
+                feasible &= objectives[:, 1] <= task.max_latency
+
+            digits = digits[feasible]
+            objectives = objectives[feasible]
+
+            survivors = non_dominated_mask(objectives)
+
+            for row, values in zip(digits[survivors].tolist(), objectives[survivors].tolist()):
+                pareto_set.add(
+                    CompactCandidate(space.architecture_key(row), tuple(values))
+                )
+
+        return [candidate.materialize(self.registry) for candidate in pareto_set]
+
+    @staticmethod
+    def _register_evaluations(context: SynthesisContext, count: int) -> int:
+        """
+        Register up to count evaluations, return how many the budget allowed
+        """
+
+        for registered in range(count):
+            try:
+                context.register_evaluation()
+            except BudgetExceeded:
+                return registered
+
+        return count
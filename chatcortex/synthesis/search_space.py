@@ -0,0 +1,247 @@
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from chatcortex.graph.agent_graph import AgentGraph
+from chatcortex.optimization.architecture_candidate import ArchitectureCandidate
+from chatcortex.registry.capability_registry import CachedCapabilityRegistry, CapabilityRegistry
+from chatcortex.registry.metadata import ComponentMetadata
+from chatcortex.synthesis.task_specification import TaskSpecification
+
+
+# Relative slack on the optimistic completion bounds: pruning must never
+# be wrong because a bound and the real total were summed in a different
+# order
+BOUND_SLACK = 1e-9
+
+
+class ChainSearchSpace:
+    """
+    Index-based view of the architecture space of a chain task
+
+    An architecture is a tuple of component indices, one per stage.
+    Architectures are ordered lexicographically (first stage most
+    significant), i.e. the same order as itertools.product over the
+    per-stage candidate lists, which also defines their mixed-radix
+    integer index.
+
+    Objectives are computed with the same accumulation order as
+    AgentGraph, so values are bit-identical to graph.total_cost() etc.
+    """
+
+    def __init__(self, stage_candidates: Sequence[Sequence[ComponentMetadata]]):
+        self.stage_candidates: List[List[ComponentMetadata]] = [
+            list(candidates) for candidates in stage_candidates
+        ]
+
+        self.costs = [[c.cost_per_call for c in s] for s in self.stage_candidates]
+        self.latencies = [[c.avg_latency_ms for c in s] for s in self.stage_candidates]
+        self.reliabilities = [[c.reliability_score for c in s] for s in self.stage_candidates]
+
+        self.radices: Tuple[int, ...] = tuple(len(s) for s in self.stage_candidates)
+
+        self.cost_arrays = [np.asarray(values, dtype=float) for values in self.costs]
+        self.latency_arrays = [np.asarray(values, dtype=float) for values in self.latencies]
+        self.reliability_arrays = [np.asarray(values, dtype=float) for values in self.reliabilities]
+
+        # Optimistic completion bounds: index k covers stages k..end
+        num_stages = len(self.stage_candidates)
+        self.min_remaining_cost = [0.0] * (num_stages + 1)
+        self.min_remaining_latency = [0.0] * (num_stages + 1)
+        self.max_remaining_reliability = [1.0] * (num_stages + 1)
+
+        if not self.is_empty:
+            for k in range(num_stages - 1, -1, -1):
+                self.min_remaining_cost[k] = self.min_remaining_cost[k + 1] + min(self.costs[k])
+                self.min_remaining_latency[k] = self.min_remaining_latency[k + 1] + min(self.latencies[k])
+                self.max_remaining_reliability[k] = (
+                    self.max_remaining_reliability[k + 1] * max(self.reliabilities[k])
+                )
+
+    @classmethod
+    def from_task(
+        cls,
+        registry: CapabilityRegistry,
+        task: TaskSpecification,
+    ) -> "ChainSearchSpace":
+
+        def build() -> "ChainSearchSpace":
+            return cls([
+                registry.get_by_capability(
+                    capability=capability,
+                    privacy_constraint=task.privacy_constraint,
+                )
+                for capability in task.required_capabilities
+            ])
+
+        if isinstance(registry, CachedCapabilityRegistry):
+            # Shared by tasks with the same capabilities and privacy
+            # constraint (task constraints do not change the space)
+            return registry.memoize(
+                ("search_space", tuple(task.required_capabilities), task.privacy_constraint),
+                build,
+            )
+
+        return build()
+
+    # Shape
+
+    @property
+    def num_stages(self) -> int:
+        return len(self.stage_candidates)
+
+    @property
+    def is_empty(self) -> bool:
+        """
+        True if some stage has no candidate (no architecture exists)
+        """
+        return any(radix == 0 for radix in self.radices)
+
+    @property
+    def size(self) -> int:
+        if self.is_empty:
+            return 0
+
+        size = 1
+        for radix in self.radices:
+            size *= radix
+        return size
+
+    # Mixed-radix indexing
+
+    def decode(self, index: int) -> Tuple[int, ...]:
+        digits = []
+        for radix in reversed(self.radices):
+            index, digit = divmod(index, radix)
+            digits.append(digit)
+        return tuple(reversed(digits))
+
+    def encode(self, indices: Sequence[int]) -> int:
+        index = 0
+        for radix, digit in zip(self.radices, indices):
+            index = index * radix + digit
+        return index
+
+    def iter_indices(self, start: int = 0, stop: Optional[int] = None) -> Iterator[Tuple[int, ...]]:
+        """
+        Lazily yield architectures start..stop-1 in lexicographic order
+        """
+
+        stop = self.size if stop is None else min(stop, self.size)
+
+        if start >= stop:
+            return
+
+        digits = list(self.decode(start))
+
+        for _ in range(stop - start):
+            yield tuple(digits)
+
+            # Odometer increment
+            for stage in range(self.num_stages - 1, -1, -1):
+                digits[stage] += 1
+                if digits[stage] < self.radices[stage]:
+                    break
+                digits[stage] = 0
+
+    # Vectorized views
+
+    def encode_batch(self, digits: np.ndarray) -> np.ndarray:
+        """
+        Mixed-radix indices of an (n, num_stages) digit matrix (size < 2**63)
+        """
+
+        index_array = np.zeros(len(digits), dtype=np.int64)
+        for stage, radix in enumerate(self.radices):
+            index_array = index_array * radix + digits[:, stage]
+        return index_array
+
+    def digits_batch(self, index_array: np.ndarray) -> np.ndarray:
+        """
+        Decode an array of mixed-radix indices into an (n, num_stages) digit matrix
+        """
+
+        index_array = np.asarray(index_array, dtype=np.int64)
+        digits = np.empty((len(index_array), self.num_stages), dtype=np.int64)
+
+        remainder = index_array.copy()
+        for stage in range(self.num_stages - 1, -1, -1):
+            remainder, digits[:, stage] = np.divmod(remainder, self.radices[stage])
+
+        return digits
+
+    def objectives_batch(self, digits: np.ndarray) -> np.ndarray:
+        """
+        (n, 3) objective matrix for an (n, num_stages) digit matrix
+
+        Accumulates stage by stage like objectives(), so every row is
+        bit-identical to the scalar computation.
+        """
+
+        n = len(digits)
+        total_cost = np.zeros(n)
+        total_latency = np.zeros(n)
+        total_reliability = np.ones(n)
+
+        for stage in range(self.num_stages):
+            column = digits[:, stage]
+            total_cost += self.cost_arrays[stage][column]
+            total_latency += self.latency_arrays[stage][column]
+            total_reliability *= self.reliability_arrays[stage][column]
+
+        return np.column_stack((total_cost, total_latency, total_reliability))
+
+    # Architecture views
+
+    def components(self, indices: Sequence[int]) -> List[ComponentMetadata]:
+        return [
+            self.stage_candidates[stage][idx] for stage, idx in enumerate(indices)
+        ]
+
+    def architecture_key(self, indices: Sequence[int]) -> Tuple[str, ...]:
+        return tuple(component.name for component in self.components(indices))
+
+    def objectives(self, indices: Sequence[int]) -> Tuple[float, float, float]:
+        total_cost = 0.0
+        total_latency = 0.0
+        total_reliability = 1.0
+
+        for stage, idx in enumerate(indices):
+            total_cost += self.costs[stage][idx]
+            total_latency += self.latencies[stage][idx]
+            total_reliability *= self.reliabilities[stage][idx]
+
+        return total_cost, total_latency, total_reliability
+
+    def is_feasible(
+        self,
+        task: TaskSpecification,
+        total_cost: float,
+        total_latency: float,
+    ) -> bool:
+        if task.max_cost is not None and total_cost > task.max_cost:
+            return False
+
+        if task.max_latency is not None and total_latency > task.max_latency:
+            return False
+
+        return True
+
+    def build_graph(self, indices: Sequence[int]) -> AgentGraph:
+        return AgentGraph.from_chain(self.components(indices))
+
+    def to_candidate(
+        self,
+        indices: Sequence[int],
+        objectives: Optional[Tuple[float, float, float]] = None,
+    ) -> ArchitectureCandidate:
+        total_cost, total_latency, total_reliability = (
+            objectives if objectives is not None else self.objectives(indices)
+        )
+
+        return ArchitectureCandidate(
+            graph=self.build_graph(indices),
+            total_cost=total_cost,
+            total_latency=total_latency,
+            total_reliability=total_reliability,
+        )
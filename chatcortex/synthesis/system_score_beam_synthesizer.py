@@ -1,11 +1,10 @@
-from typing import List, Tuple
+from typing import List, Optional
 
-from chatcortex.graph.agent_graph import AgentGraph
 from chatcortex.optimization.architecture_candidate import ArchitectureCandidate
-from chatcortex.optimization.pareto import ParetoSet
-from chatcortex.registry.metadata import ComponentMetadata
 from chatcortex.synthesis.base import Synthesizer
-from chatcortex.synthesis.budget import BudgetExceeded, SynthesisBudget, SynthesisContext
+from chatcortex.synthesis.beam_engine import BeamEngine, PrefixState, keep_top, rank_by_key
+from chatcortex.synthesis.budget import SynthesisBudget, SynthesisContext
+from chatcortex.synthesis.search_space import ChainSearchSpace
 from chatcortex.synthesis.task_specification import TaskSpecification
 
 
@@ -15,19 +14,23 @@ class SystemScoreBeamSynthesizer(Synthesizer):
     instead of per-component scalar increments
     """
 
-    def __init__(self, registry, beam_width: int = 3):
-        super().__init__(registry)
+    def __init__(
+        self,
+        registry,
+        beam_width: int = 3,
+        num_workers: Optional[int] = None,
+        archive_factory=None,
+        evaluator=None,
+    ):
+        super().__init__(registry, archive_factory=archive_factory, evaluator=evaluator)
         self.beam_width = beam_width
+        self.num_workers = num_workers
 
-    def _system_score(self, graph: AgentGraph, weights: dict) -> float:
-        total_cost = graph.total_cost()
-        total_latency = graph.total_latency()
-        total_reliability = graph.aggregate_reliability()
-
+    def _system_score(self, state: PrefixState, weights: dict) -> float:
         return (
-            weights["cost"] * total_cost
-            + weights["latency"] * total_latency
-            - weights["error"] * total_reliability
+            weights["cost"] * state.total_cost
+            + weights["latency"] * state.total_latency
+            - weights["error"] * state.total_reliability
         )
     
     def synthesize(
@@ -40,79 +43,17 @@ class SystemScoreBeamSynthesizer(Synthesizer):
 
         context = SynthesisContext(budget)
         
-        # Each beam element = (graph, cumulative_score)
-        beam: List[Tuple[AgentGraph, float]] = [(AgentGraph(), 0.0)]
-
-        for stage_idx, capability in enumerate(task.required_capabilities):
-
-            new_beam: List[Tuple[AgentGraph, float]] = []
-
-            for graph, _ in beam:
-
-                candidates = self.registry.get_by_capability(
-                    capability=capability,
-                    privacy_constraint=task.privacy_constraint,
-                )
-
-                if not candidates:
-                    continue
-
-                for component in candidates:
-                    
-                    new_graph = graph.copy()
-
-                    node_id = f"{component.name}_{stage_idx}"
-                    new_graph.add_component(node_id, component)
-
-                    if stage_idx > 0:
-                        prev_nodes = list(new_graph._graph.nodes)
-                        if len(prev_nodes) > 1:
-                            new_graph.add_edge(prev_nodes[-2], prev_nodes[-1])
-                    
-                    score = self._system_score(
-                        new_graph, task.objective_weights
-                    )
-
-                    new_beam.append(
-                        (new_graph, score)
-                    )
-            
-            # Sort by global system score
-            new_beam.sort(key=lambda x: x[1])
-
-            # Prune except final stage
-            if stage_idx < len(task.required_capabilities) - 1:
-                beam = new_beam[: self.beam_width]
-            else:
-                beam = new_beam # Keep all final candidates
-        
-        beam.sort(key=lambda x: x[1])
-        pareto_set = ParetoSet()
-
-        for graph, _ in beam:
-
-            try:
-                context.register_evaluation()
-            except BudgetExceeded:
-                break
-
-            total_cost = graph.total_cost()
-            total_latency = graph.total_latency()
-            total_reliability = graph.aggregate_reliability()
-
-            if task.max_cost is not None and total_cost > task.max_cost:
-                continue
-
-            if task.max_latency is not None and total_latency > task.max_latency:
-                continue
-
-            candidate = ArchitectureCandidate(
-                graph=graph,
-                total_cost=total_cost,
-                total_latency=total_latency,
-                total_reliability=total_reliability,
-            )        
+        # Sort by global system score, prune except final stage
+        engine = BeamEngine(
+            rank=rank_by_key(
+                lambda state: self._system_score(state, task.objective_weights)
+            ),
+            truncate=keep_top(self.beam_width),
+            num_workers=self.num_workers,
+            evaluator=self.evaluator,
+        )
 
-            pareto_set.add(candidate=candidate)
+        space = ChainSearchSpace.from_task(self.registry, task)
+        pareto_set = engine.run(space, task, context, self._new_archive())
         
-        return list(pareto_set)
\ No newline at end of file
+        return list(pareto_set)
@@ -0,0 +1,188 @@
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from chatcortex.optimization.architecture_candidate import ArchitectureCandidate
+from chatcortex.optimization.vectorized import non_dominated_mask
+from chatcortex.synthesis.base import Synthesizer
+from chatcortex.synthesis.budget import BudgetExceeded, SynthesisBudget, SynthesisContext
+from chatcortex.synthesis.search_space import ChainSearchSpace
+from chatcortex.synthesis.task_specification import TaskSpecification
+
+
+# Share of every weight vector spread evenly over all objectives, so
+# weights are strictly positive and argmins are Pareto-optimal
+_WEIGHT_FLOOR = 1e-6
+
+
+def simplex_weights(resolution: int) -> np.ndarray:
+    """
+    All weight vectors (i, j, k) / resolution with i + j + k = resolution
+    """
+
+    if resolution < 1:
+        raise ValueError("resolution must be positive")
+
+    return np.array(
+        [
+            (i, j, resolution - i - j)
+            for i in range(resolution + 1)
+            for j in range(resolution + 1 - i)
+        ],
+        dtype=float,
+    ) / resolution
+
+
+class WeightSweepSynthesizer(Synthesizer):
+    """
+    Supported Pareto points of a chain task by weighted-sum scalarization
+
+    For weights (w_cost, w_latency, w_reliability) the chain minimizing
+
+        w_cost * total_cost + w_latency * total_latency
+            - w_reliability * log(total_reliability)
+
+    is the per-stage argmin of the same weighted sum of component metrics
+    (-log turns the reliability product into a sum). Objectives are
+    normalized by their range over the space, so an even weight grid
+    spreads over the whole frontier. Every weight vector of the sweep is
+    solved at once: one (candidates x weights) matrix product and argmin
+    per stage.
+
+    weights:
+        (m, 3) weight vectors; defaults to the simplex grid of the given
+        resolution ((resolution + 1)(resolution + 2) / 2 vectors)
+
+    Only supported points (on the convex hull of the frontier, in the
+    normalized objective space) can be found. Constraints are not
+    separable over stages, so optima violating max_cost / max_latency are
+    dropped rather than repaired.
+
+    Budget:
+        One evaluation per distinct architecture found.
+
+    seed_genomes() returns the same architectures as component indices,
+    e.g. for EvolutionarySynthesizer(seeder=...).
+    """
+
+    def __init__(
+        self,
+        registry,
+        resolution: int = 20,
+        weights: Optional[Sequence[Sequence[float]]] = None,
+        archive_factory=None,
+        evaluator=None,
+    ):
+        super().__init__(registry, archive_factory=archive_factory, evaluator=evaluator)
+
+        if weights is None:
+            weights = simplex_weights(resolution)
+
+        weights = np.asarray(weights, dtype=float)
+
+        if weights.ndim != 2 or weights.shape[1] != 3 or len(weights) == 0:
+            raise ValueError("weights must be an (m, 3) array")
+
+        if (weights < 0).any() or (weights.sum(axis=1) <= 0).any():
+            raise ValueError("weights must be non-negative and not all zero")
+
+        weights = weights / weights.sum(axis=1, keepdims=True)
+        self.weights = (1.0 - _WEIGHT_FLOOR) * weights + _WEIGHT_FLOOR / 3.0
+
+    def supported_indices(self, space: ChainSearchSpace) -> np.ndarray:
+        """
+        Distinct per-stage argmins over all weight vectors (unconstrained)
+
+        Returns an (n, num_stages) array of component indices, in order of
+        the first weight vector producing each architecture.
+        """
+
+        if space.is_empty:
+            return np.zeros((0, space.num_stages), dtype=np.int64)
+
+        tiny = np.finfo(float).tiny
+        stage_metrics = [
+            np.column_stack((
+                space.cost_arrays[stage],
+                space.latency_arrays[stage],
+                -np.log(np.maximum(space.reliability_arrays[stage], tiny)),
+            ))
+            for stage in range(space.num_stages)
+        ]
+
+        ranges = sum(metrics.max(axis=0) - metrics.min(axis=0) for metrics in stage_metrics)
+        scale = 1.0 / np.where(ranges > 0, ranges, 1.0)
+
+        scaled_weights = (self.weights * scale).T
+
+        digits = np.column_stack([
+            np.argmin(metrics @ scaled_weights, axis=0) for metrics in stage_metrics
+        ])
+
+        _, first = np.unique(digits, axis=0, return_index=True)
+        return digits[np.sort(first)]
+
+    def seed_genomes(
+        self,
+        space: ChainSearchSpace,
+        task: TaskSpecification,
+    ) -> List[Tuple[int, ...]]:
+        """
+        Feasible, non-dominated supported architectures as index tuples
+        """
+
+        digits = self.supported_indices(space)
+
+        if len(digits) == 0:
+            return []
+
+        objectives = space.objectives_batch(digits)
+        feasible = np.ones(len(digits), dtype=bool)
+
+        if task.max_cost is not None:
+            feasible &= objectives[:, 0] <= task.max_cost
+
+        if task.max_latency is not None:
+            feasible &= objectives[:, 1] <= task.max_latency
+
+        digits, objectives = digits[feasible], objectives[feasible]
+
+        if len(digits) == 0:
+            return []
+
+        return [tuple(row) for row in digits[non_dominated_mask(objectives)].tolist()]
+
+    def synthesize(
+        self,
+        task: TaskSpecification,
+        budget: Optional[SynthesisBudget] = None,
+    ) -> List[ArchitectureCandidate]:
+
+        task.validate()
+
+        context = SynthesisContext(budget)
+        pareto_set = self._new_archive()
+
+        space = ChainSearchSpace.from_task(self.registry, task)
+        architectures = [tuple(row) for row in self.supported_indices(space).tolist()]
+
+        if self.evaluator is not None:
+            evaluated = self.evaluator.evaluate_batch(
+                [space.components(indices) for indices in architectures], context
+            )
+        else:
+            evaluated = []
+            for indices in architectures:
+                try:
+                    context.register_evaluation()
+                except BudgetExceeded:
+                    break
+                evaluated.append(space.objectives(indices))
+
+        for indices, objectives in zip(architectures, evaluated):
+            if objectives is None or not space.is_feasible(task, objectives[0], objectives[1]):
+                continue
+
+            pareto_set.add(space.to_candidate(indices, objectives))
+
+        return list(pareto_set)